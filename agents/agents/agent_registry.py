@@ -1,23 +1,23 @@
+import asyncio
 import os
-import sys
 from typing import Dict, AsyncIterator
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from dotenv import load_dotenv
-from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage
 
 from deepagents import create_deep_agent
 from deepagents.backends import FilesystemBackend
-from langgraph.checkpoint.memory import MemorySaver
 
+from agents.checkpointer import BoundedMemorySaver
+from agents.llm_clients import get_chat_model
 from agents.modal_volume_backend import ModalVolumeBackend
 
 load_dotenv()
 
 
-CHECKPOINTER = MemorySaver()
+CHECKPOINTER = BoundedMemorySaver(
+    max_threads=int(os.getenv("PARTYHAT_MAX_CHECKPOINT_THREADS") or "512")
+)
 
 
 FILESYSTEM_RESTRICTION_PROMPT = """
@@ -139,6 +139,8 @@ You have access to tools. Use them actively and consciously:
   Do NOT wait until the end, save frequently to prevent data loss
 - Call save_reasoning_note() whenever a significant decision is made or
   clarified (why ERC-721 over ERC-20, why a function was added, etc.)
+  When several decisions land in the same turn, record them together with
+  one save_reasoning_notes() call instead of one call per note.
 - Call send_question_batch() whenever you ask one or more clarifying questions.
   Ask 1-5 related unanswered questions in a single turn; never exceed 5.
   Each question may include 0-5 answer_recommendations.
@@ -796,9 +798,8 @@ def _build_agent(tools, system_prompt: str):
         )
         return FilesystemBackend(root_dir=root_dir, virtual_mode=True)
 
-    llm = ChatOpenAI(model="gpt-5.2-2025-12-11", temperature=0.3)
     return create_deep_agent(
-        model=llm,
+        model=get_chat_model("gpt-5.2-2025-12-11", 0.3),
         tools=tools,
         system_prompt=system_prompt,
         checkpointer=CHECKPOINTER,
@@ -853,6 +854,41 @@ def get_agent_for_intent(intent: str):
     return _AGENTS[intent]
 
 
+def turn_tool_calls(messages: list) -> list[str]:
+    """
+    Names of tools called in the latest turn, in call order.
+
+    The checkpointed history grows every turn, so only the messages after the
+    most recent HumanMessage are inspected instead of rescanning the thread.
+    """
+    start = len(messages)
+    while start > 0 and not isinstance(messages[start - 1], HumanMessage):
+        start -= 1
+    return [
+        tc.get("name", "")
+        for msg in messages[start:]
+        for tc in (getattr(msg, "tool_calls", None) or [])
+    ]
+
+
+def build_chat_response(intent: str, session_id: str, messages: list) -> dict:
+    """Build the chat reply payload from the agent's final message list."""
+    from agents.planning_tools import (
+        get_answer_recommendations,
+        get_pending_questions,
+    )
+
+    return {
+        "session_id": session_id,
+        "response": messages[-1].content,
+        "tool_calls": turn_tool_calls(messages),
+        "answer_recommendations": (
+            get_answer_recommendations() if intent == "planning" else []
+        ),
+        "pending_questions": get_pending_questions() if intent == "planning" else [],
+    }
+
+
 def chat_with_intent(
     intent: str,
     session_id: str,
@@ -864,12 +900,7 @@ def chat_with_intent(
     Route a message to the appropriate deep agent based on the intent.
     When project_id is set, it is used as thread_id for per-project conversation history.
     """
-    from agents.planning_tools import (
-        get_answer_recommendations,
-        get_approval_request,
-        get_pending_questions,
-        clear_pending_questions,
-    )
+    from agents.planning_tools import ReasoningNoteBatch, clear_pending_questions
 
     agent = get_agent_for_intent(intent)
     thread_id = thread_id_override or (project_id if project_id else session_id)
@@ -877,29 +908,42 @@ def chat_with_intent(
     if intent == "planning":
         clear_pending_questions()
 
-    result = agent.invoke(
-        {"messages": [HumanMessage(content=user_message)]},
-        config=config,
-    )
+    with ReasoningNoteBatch():
+        result = agent.invoke(
+            {"messages": [HumanMessage(content=user_message)]},
+            config=config,
+        )
+    return build_chat_response(intent, session_id, result["messages"])
+
 
-    final_message = result["messages"][-1]
-    response_text = final_message.content
+async def achat_with_intent(
+    intent: str,
+    session_id: str,
+    user_message: str,
+    project_id: str | None = None,
+    thread_id_override: str | None = None,
+) -> dict:
+    """
+    Async variant of chat_with_intent for use inside the API event loop.
+    The agent turn is awaited via ainvoke and the blocking memory reads run
+    in worker threads, so concurrent sessions overlap model latency.
+    """
+    from agents.planning_tools import ReasoningNoteBatch, clear_pending_questions
 
-    tool_calls_made = []
-    for msg in result["messages"]:
-        if hasattr(msg, "tool_calls") and msg.tool_calls:
-            for tc in msg.tool_calls:
-                tool_calls_made.append(tc["name"])
+    agent = get_agent_for_intent(intent)
+    thread_id = thread_id_override or (project_id if project_id else session_id)
+    config = {"configurable": {"thread_id": thread_id}}
+    if intent == "planning":
+        await asyncio.to_thread(clear_pending_questions)
 
-    return {
-        "session_id": session_id,
-        "response": response_text,
-        "tool_calls": tool_calls_made,
-        "answer_recommendations": (
-            get_answer_recommendations() if intent == "planning" else []
-        ),
-        "pending_questions": get_pending_questions() if intent == "planning" else [],
-    }
+    async with ReasoningNoteBatch():
+        result = await agent.ainvoke(
+            {"messages": [HumanMessage(content=user_message)]},
+            config=config,
+        )
+    return await asyncio.to_thread(
+        build_chat_response, intent, session_id, result["messages"]
+    )
 
 
 def _message_to_event_payload(msg) -> dict:
@@ -918,21 +962,54 @@ def _message_to_event_payload(msg) -> dict:
     return payload
 
 
+def is_reply_token_event(event: dict) -> bool:
+    """
+    True for tokens from the agent graph's own model node. Subagents run
+    as nested graphs (namespaced checkpoint_ns) and generation tools call
+    models from the tools node, so their tokens are not part of the reply.
+    """
+    if event["event"] != "on_chat_model_stream":
+        return False
+    metadata = event.get("metadata") or {}
+    return (
+        metadata.get("langgraph_node") == "model"
+        and "|" not in (metadata.get("langgraph_checkpoint_ns") or "")
+    )
+
+
+def chunk_text(content) -> str:
+    """Text of a streamed chunk, whether plain or a list of content blocks."""
+    if isinstance(content, str):
+        return content
+    if not isinstance(content, list):
+        return ""
+    parts = []
+    for block in content:
+        if isinstance(block, str):
+            parts.append(block)
+        elif isinstance(block, dict) and block.get("type", "text") == "text":
+            parts.append(block.get("text") or "")
+    return "".join(parts)
+
+
 async def stream_chat_with_intent(
     intent: str,
     session_id: str,
     user_message: str,
     project_id: str | None = None,
     thread_id_override: str | None = None,
+    stream_tokens: bool = False,
 ) -> AsyncIterator[dict]:
     """
     Stream agent responses and tool calls for the given intent.
     Yields event dicts: {"type": "step", "content": ..., "tool_calls": ...} per step,
     then {"type": "done", "session_id": ..., "response": ..., "tool_calls": [...]}.
     Planning done events also include approval_request, answer_recommendations,
-    and pending_questions.
+    and pending_questions. With stream_tokens, reply tokens are also yielded as
+    {"type": "token", "content": ...} while the model generates them.
     """
     from agents.planning_tools import (
+        ReasoningNoteBatch,
         get_answer_recommendations,
         get_approval_request,
         get_pending_questions,
@@ -946,18 +1023,34 @@ async def stream_chat_with_intent(
         clear_pending_questions()
 
     last_chunk = None
-    async for chunk in agent.astream(
-        {"messages": [HumanMessage(content=user_message)]},
-        config=config,
-        stream_mode="values",
-    ):
-        last_chunk = chunk
-        messages = chunk.get("messages") or []
-        if not messages:
-            continue
-        last_message = messages[-1]
-        payload = _message_to_event_payload(last_message)
-        yield {"type": "step", **payload}
+    async with ReasoningNoteBatch():
+        async for event in agent.astream_events(
+            {"messages": [HumanMessage(content=user_message)]},
+            config=config,
+            version="v2",
+            stream_mode="values",
+        ):
+            if is_reply_token_event(event):
+                if stream_tokens:
+                    text = chunk_text(
+                        getattr(event["data"].get("chunk"), "content", None)
+                    )
+                    if text:
+                        yield {"type": "token", "content": text}
+                continue
+            # State snapshots of the top-level graph; nested runs have parents.
+            if event["event"] != "on_chain_stream" or event.get("parent_ids"):
+                continue
+            chunk = event["data"].get("chunk")
+            if not isinstance(chunk, dict):
+                continue
+            last_chunk = chunk
+            messages = chunk.get("messages") or []
+            if not messages:
+                continue
+            last_message = messages[-1]
+            payload = _message_to_event_payload(last_message)
+            yield {"type": "step", **payload}
 
     if last_chunk:
         messages = last_chunk.get("messages") or []
@@ -970,16 +1063,11 @@ async def stream_chat_with_intent(
                 c.get("text", "") if isinstance(c, dict) else str(c)
                 for c in response_text
             )
-        tool_calls_made = []
-        for msg in messages:
-            if hasattr(msg, "tool_calls") and msg.tool_calls:
-                for tc in msg.tool_calls:
-                    tool_calls_made.append(tc.get("name", ""))
         yield {
             "type": "done",
             "session_id": session_id,
             "response": response_text,
-            "tool_calls": tool_calls_made,
+            "tool_calls": turn_tool_calls(messages),
             "approval_request": (
                 get_approval_request() if intent == "planning" else None
             ),
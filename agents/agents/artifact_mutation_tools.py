@@ -8,11 +8,11 @@ from agents.code_storage import get_code_storage
 
 
 def _get_memory_manager():
-    from agents.memory_manager import MemoryManager
+    from agents.memory_manager import get_memory_manager
     from agents.context import get_project_context
 
     project_id, user_id = get_project_context()
-    return MemoryManager(user_id=user_id or "default", project_id=project_id)
+    return get_memory_manager(user_id=user_id or "default", project_id=project_id)
 
 
 def _normalize_artifact_path(path: str) -> str:
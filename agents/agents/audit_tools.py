@@ -1,10 +1,6 @@
-import os
-import sys
 import json
 from typing import List
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from langchain_core.tools import tool
 
 from schemas.audit_schema import AuditIssue, AuditReport
@@ -12,11 +8,11 @@ from agents.task_tools import TASK_TOOLS
 
 
 def _get_memory_manager():
-    from agents.memory_manager import MemoryManager
+    from agents.memory_manager import get_memory_manager
     from agents.context import get_project_context
 
     project_id, user_id = get_project_context()
-    return MemoryManager(user_id=user_id or "default", project_id=project_id)
+    return get_memory_manager(user_id=user_id or "default", project_id=project_id)
 
 
 @tool
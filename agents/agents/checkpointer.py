@@ -0,0 +1,42 @@
+import threading
+from collections import OrderedDict
+
+from langgraph.checkpoint.memory import MemorySaver
+
+
+class BoundedMemorySaver(MemorySaver):
+    """
+    In-memory checkpointer that keeps at most ``max_threads`` conversations.
+
+    Every chat project and every pipeline task gets its own thread_id, so a
+    plain MemorySaver grows for the life of the process. When a new thread
+    pushes the count past the limit, the least recently written thread is
+    deleted. Plans, notes and chat transcripts live in Neon/Letta, so an
+    evicted thread only loses the agent's scratch conversation.
+    """
+
+    def __init__(self, max_threads: int = 512) -> None:
+        super().__init__()
+        self.max_threads = max(1, max_threads)
+        self._thread_order: OrderedDict[str, None] = OrderedDict()
+        self._thread_order_lock = threading.Lock()
+
+    def put(self, config, checkpoint, metadata, new_versions):
+        saved = super().put(config, checkpoint, metadata, new_versions)
+        self._touch(config["configurable"]["thread_id"])
+        return saved
+
+    def delete_thread(self, thread_id: str) -> None:
+        super().delete_thread(thread_id)
+        with self._thread_order_lock:
+            self._thread_order.pop(thread_id, None)
+
+    def _touch(self, thread_id: str) -> None:
+        evicted = []
+        with self._thread_order_lock:
+            self._thread_order[thread_id] = None
+            self._thread_order.move_to_end(thread_id)
+            while len(self._thread_order) > self.max_threads:
+                evicted.append(self._thread_order.popitem(last=False)[0])
+        for stale_thread_id in evicted:
+            self.delete_thread(stale_thread_id)
@@ -1,12 +1,8 @@
 import os
 import shlex
-import sys
 from typing import List, Dict, Any, Optional
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from langchain_core.tools import tool
-from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage
 import modal
 
@@ -25,15 +21,16 @@ from agents.modal_runtime import (
     get_modal_app,
     get_modal_volume,
 )
+from agents.llm_clients import get_chat_model
 from agents.tracing import start_span
 
 
 def _get_memory_manager():
-    from agents.memory_manager import MemoryManager
+    from agents.memory_manager import get_memory_manager
     from agents.context import get_project_context
 
     project_id, user_id = get_project_context()
-    return MemoryManager(user_id=user_id or "default", project_id=project_id)
+    return get_memory_manager(user_id=user_id or "default", project_id=project_id)
 
 
 def generate_solidity_code_direct(request: CodeGenerationRequest) -> dict:
@@ -60,7 +57,7 @@ def generate_solidity_code_direct(request: CodeGenerationRequest) -> dict:
     )
 
     model_name = os.getenv("SOLIDITY_MODEL", "gpt-5.2-2025-12-11")
-    llm = ChatOpenAI(model=model_name, temperature=0.1)
+    llm = get_chat_model(model_name, 0.1)
 
     try:
         with start_span(
@@ -468,6 +468,16 @@ async def add_reasoning_note(
     return row
 
 
+async def add_reasoning_notes(
+    session: AsyncSession,
+    project_id: uuid.UUID,
+    notes: list[str],
+) -> None:
+    """Append several reasoning notes for this project in one commit."""
+    session.add_all(ReasoningNote(project_id=project_id, note=note) for note in notes)
+    await session.commit()
+
+
 async def get_reasoning_notes(
     session: AsyncSession,
     project_id: uuid.UUID,
@@ -89,8 +89,28 @@ def _is_numeric_literal(value: str, *, signed: bool) -> bool:
     return pattern.fullmatch(value.strip()) is not None
 
 
+def _plan_function_index(plan: Any) -> dict[str, dict[str, list[Any]]]:
+    """
+    Map contract name -> function name -> overloads, built once per plan so
+    each post-deploy call is a dict lookup instead of a scan over every
+    contract and function. Overloads stay grouped in declaration order.
+    """
+    index: dict[str, dict[str, list[Any]]] = {}
+    for contract in _plan_contracts(plan):
+        contract_name = _string_field(contract, "name")
+        if not contract_name or contract_name in index:
+            continue
+        functions_by_name: dict[str, list[Any]] = {}
+        for function in _field(contract, "functions", []) or []:
+            functions_by_name.setdefault(_string_field(function, "name"), []).append(
+                function
+            )
+        index[contract_name] = functions_by_name
+    return index
+
+
 def _function_inputs_for_post_deploy_call(
-    plan: Any,
+    function_index: dict[str, dict[str, list[Any]]],
     *,
     target_contract_name: str,
     function_name: str,
@@ -99,22 +119,11 @@ def _function_inputs_for_post_deploy_call(
     strict: bool = True,
 ) -> tuple[list[str] | None, list[str]]:
     issues: list[str] = []
-    target_contract = next(
-        (
-            contract
-            for contract in _plan_contracts(plan)
-            if _string_field(contract, "name") == target_contract_name
-        ),
-        None,
-    )
-    if target_contract is None:
+    functions_by_name = function_index.get(target_contract_name)
+    if functions_by_name is None:
         return None, issues
 
-    matching_functions = [
-        function
-        for function in (_field(target_contract, "functions", []) or [])
-        if _string_field(function, "name") == function_name
-    ]
+    matching_functions = functions_by_name.get(function_name)
     if not matching_functions:
         if not strict:
             return None, issues
@@ -215,11 +224,8 @@ def _typed_post_deploy_arg_issues(
 
 def validate_post_deploy_calls(plan: Any) -> list[str]:
     issues: list[str] = []
-    known_contract_names = {
-        _string_field(contract, "name")
-        for contract in _plan_contracts(plan)
-        if _string_field(contract, "name")
-    }
+    function_index = _plan_function_index(plan)
+    known_contract_names = set(function_index)
     seen_call_orders: set[int] = set()
 
     for index, call in enumerate(_plan_post_deploy_calls(plan), start=1):
@@ -258,7 +264,7 @@ def validate_post_deploy_calls(plan: Any) -> list[str]:
             continue
 
         input_types, lookup_issues = _function_inputs_for_post_deploy_call(
-            plan,
+            function_index,
             target_contract_name=target_contract_name,
             function_name=function_name,
             arg_count=len(args),
@@ -296,6 +302,7 @@ def remediate_manifest_post_deploy_calls(
 ) -> tuple[DeploymentManifest, list[str], list[str], bool]:
     remediated = manifest.model_copy(deep=True)
     known_contract_names = {contract.name for contract in remediated.contracts}
+    function_index = _plan_function_index(plan)
     notes: list[str] = []
     issues: list[str] = []
     changed = False
@@ -303,7 +310,7 @@ def remediate_manifest_post_deploy_calls(
     for index, call in enumerate(remediated.post_deploy_calls, start=1):
         context = f"post_deploy_calls[{index}]"
         input_types, lookup_issues = _function_inputs_for_post_deploy_call(
-            plan,
+            function_index,
             target_contract_name=call.target_contract_name,
             function_name=call.function_name,
             arg_count=len(call.args),
@@ -623,12 +630,36 @@ def dump_deployment_manifest(manifest: DeploymentManifest) -> str:
     return json.dumps(manifest.model_dump(), indent=2, sort_keys=True)
 
 
+_MANIFEST_REQUIRED_KEYS = ("deployment_target", "contracts")
+
+
+def _quick_manifest_reject(raw: Any) -> str | None:
+    """Cheap structural checks that run before the full pydantic validation."""
+    if isinstance(raw, str):
+        stripped = raw.lstrip()
+        if not stripped:
+            return "Deployment manifest is empty."
+        if not stripped.startswith("{"):
+            return "Deployment manifest must be a JSON object."
+        return None
+    if not isinstance(raw, dict):
+        return "Deployment manifest must be a JSON object."
+    missing = [key for key in _MANIFEST_REQUIRED_KEYS if key not in raw]
+    if missing:
+        return f"Deployment manifest is missing required field(s): {', '.join(missing)}."
+    if not isinstance(raw["contracts"], list):
+        return "Deployment manifest contracts must be a list."
+    return None
+
+
 def load_deployment_manifest(raw: str | dict[str, Any]) -> DeploymentManifest:
+    rejection = _quick_manifest_reject(raw)
+    if rejection:
+        raise ValueError(rejection)
     if isinstance(raw, str):
-        payload = json.loads(raw)
-    else:
-        payload = raw
-    return DeploymentManifest.model_validate(payload)
+        # Parse and validate in one pydantic-core pass.
+        return DeploymentManifest.model_validate_json(raw)
+    return DeploymentManifest.model_validate(raw)
 
 
 def validate_deploy_script_against_manifest(
@@ -2,7 +2,6 @@ import json
 import os
 import re
 import shlex
-import sys
 import threading
 from datetime import datetime, timezone
 from pathlib import Path
@@ -12,10 +11,24 @@ from urllib import request as urllib_request
 # Platform limit for tool response payload (e.g. Modal/OpenAI). Stay under to avoid INVALID_ARGUMENT.
 MAX_RESPONSE_CHARS = 48_000
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Compiled once: these run over every forge/broadcast payload we parse.
+_TX_HASH_OUTPUT_PATTERN = re.compile(
+    r"(?:tx hash|transaction hash|hash)\s*[:=]\s*(0x[a-fA-F0-9]{64})",
+    re.IGNORECASE,
+)
+_DEPLOYED_ADDRESS_OUTPUT_PATTERN = re.compile(
+    r"(?:deployed to|deployed at|contract address)\s*[:=]\s*(0x[a-fA-F0-9]{40})",
+    re.IGNORECASE,
+)
+_HEX_VALUE_PATTERNS = {
+    40: re.compile(r"0x[0-9a-fA-F]{40}"),
+    64: re.compile(r"0x[0-9a-fA-F]{64}"),
+}
+_BARE_PRIVATE_KEY_PATTERN = re.compile(r"[0-9a-fA-F]{64}")
+_NON_ALNUM_PATTERN = re.compile(r"[^A-Za-z0-9]+")
+_IDENTIFIER_START_PATTERN = re.compile(r"[A-Za-z_]")
 
 from langchain_core.tools import tool
-from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage
 import modal
 
@@ -54,16 +67,21 @@ from agents.modal_runtime import (
     get_modal_volume,
 )
 from agents.pipeline_cancel import is_pipeline_cancelled
-from agents.pipeline_context import compact_execution_summary
+from agents.pipeline_context import (
+    compact_execution_summary,
+    dumps_json,
+    format_prompt_json,
+)
+from agents.llm_clients import get_chat_model
 from agents.tracing import current_trace_id, start_span
 
 
 def _get_memory_manager():
-    from agents.memory_manager import MemoryManager
+    from agents.memory_manager import get_memory_manager
     from agents.context import get_project_context
 
     project_id, user_id = get_project_context()
-    return MemoryManager(user_id=user_id or "default", project_id=project_id)
+    return get_memory_manager(user_id=user_id or "default", project_id=project_id)
 
 
 def _redact_text(value: Optional[str], secrets: List[str]) -> str:
@@ -76,8 +94,8 @@ def _redact_text(value: Optional[str], secrets: List[str]) -> str:
     return redacted
 
 
-def _extract_first(pattern: str, text: str) -> Optional[str]:
-    match = re.search(pattern, text, flags=re.IGNORECASE)
+def _extract_first(pattern: re.Pattern[str], text: str) -> Optional[str]:
+    match = pattern.search(text)
     return match.group(1) if match else None
 
 
@@ -98,7 +116,10 @@ def _normalize_hex_match(value: Any, hex_len: int) -> Optional[str]:
     if not isinstance(value, str):
         return None
     normalized = value.strip()
-    if not re.fullmatch(rf"0x[0-9a-fA-F]{{{hex_len}}}", normalized):
+    pattern = _HEX_VALUE_PATTERNS.get(hex_len) or re.compile(
+        rf"0x[0-9a-fA-F]{{{hex_len}}}"
+    )
+    if not pattern.fullmatch(normalized):
         return None
     return f"0x{normalized[2:]}"
 
@@ -113,14 +134,14 @@ def _normalize_contract_name(value: Any) -> Optional[str]:
 
 
 def _instance_name(contract_name: str, *, used: set[str] | None = None) -> str:
-    pieces = [piece for piece in re.split(r"[^A-Za-z0-9]+", contract_name) if piece]
+    pieces = [piece for piece in _NON_ALNUM_PATTERN.split(contract_name) if piece]
     if not pieces:
         base = "deployedContract"
     else:
         base = pieces[0][:1].lower() + pieces[0][1:]
         for piece in pieces[1:]:
             base += piece[:1].upper() + piece[1:]
-    if not re.match(r"^[A-Za-z_]", base):
+    if not _IDENTIFIER_START_PATTERN.match(base):
         base = f"contract{base}"
     candidate = base
     if used is None:
@@ -738,7 +759,7 @@ def _normalize_private_key_hex(value: str) -> str:
     normalized = (value or "").strip()
     if normalized.startswith(("0x", "0X")):
         return f"0x{normalized[2:]}"
-    if re.fullmatch(r"[0-9a-fA-F]{64}", normalized):
+    if _BARE_PRIVATE_KEY_PATTERN.fullmatch(normalized):
         return f"0x{normalized}"
     return normalized
 
@@ -864,24 +885,25 @@ def _truncate_for_display(text: str, max_chars: int, label: str = "output") -> s
     return text[:half] + notice + text[-half:]
 
 
+def _json_size(payload: Dict[str, Any]) -> int:
+    return len(dumps_json(payload))
+
+
 def _cap_response_with_stdout_stderr(
     response: Dict[str, Any], truncation_note: str
 ) -> Dict[str, Any]:
     """If response JSON would exceed MAX_RESPONSE_CHARS, truncate stdout/stderr."""
-    payload = json.dumps(response)
-    if len(payload) <= MAX_RESPONSE_CHARS:
+    if _json_size(response) <= MAX_RESPONSE_CHARS:
         return response
     response = dict(response)
-    overhead = len(
-        json.dumps(
-            {
-                **response,
-                "stdout": "",
-                "stderr": "",
-                "output_truncated": True,
-                "truncation_note": truncation_note,
-            }
-        )
+    overhead = _json_size(
+        {
+            **response,
+            "stdout": "",
+            "stderr": "",
+            "output_truncated": True,
+            "truncation_note": truncation_note,
+        }
     )
     allowance = max(0, MAX_RESPONSE_CHARS - overhead - 200)
     max_stdout = allowance // 2
@@ -937,15 +959,8 @@ def _combine_deployment_errors(
 
 def _parse_deploy_output(stdout: str, stderr: str) -> Dict[str, Optional[str]]:
     combined = f"{stdout}\n{stderr}"
-    tx_hash = _extract_first(
-        r"(?:tx hash|transaction hash|hash)\s*[:=]\s*(0x[a-fA-F0-9]{64})",
-        combined,
-    )
-
-    deployed_address = _extract_first(
-        r"(?:deployed to|deployed at|contract address)\s*[:=]\s*(0x[a-fA-F0-9]{40})",
-        combined,
-    )
+    tx_hash = _extract_first(_TX_HASH_OUTPUT_PATTERN, combined)
+    deployed_address = _extract_first(_DEPLOYED_ADDRESS_OUTPUT_PATTERN, combined)
 
     return {"tx_hash": tx_hash, "deployed_address": deployed_address}
 
@@ -981,7 +996,7 @@ def generate_foundry_deploy_script_direct(
     if request.deployment_manifest:
         manifest_section = (
             "\n\nAuthoritative deployment manifest:\n"
-            f"{json.dumps(request.deployment_manifest, indent=2, sort_keys=True)}"
+            f"{format_prompt_json(request.deployment_manifest, sort_keys=True)}"
         )
 
     args_comment = (
@@ -1020,7 +1035,7 @@ def generate_foundry_deploy_script_direct(
     )
 
     model_name = os.getenv("FOUNDRY_DEPLOY_SCRIPT_MODEL", "gpt-5.2-2025-12-11")
-    llm = ChatOpenAI(model=model_name, temperature=0.1)
+    llm = get_chat_model(model_name, 0.1)
 
     try:
         with start_span(
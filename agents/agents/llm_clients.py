@@ -0,0 +1,95 @@
+import asyncio
+import os
+import threading
+import weakref
+from functools import lru_cache
+
+import httpx
+from langchain_openai import ChatOpenAI
+
+
+# One pooled transport per process so every agent turn and generation tool
+# reuses warm TCP/TLS connections to the model provider. httpx closes idle
+# connections after 5s by default, which is shorter than the gap between
+# agent turns, so keep them for as long as provider load balancers allow.
+_HTTP_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=90.0,
+)
+
+
+@lru_cache(maxsize=1)
+def get_http_client() -> httpx.Client:
+    return httpx.Client(limits=_HTTP_LIMITS)
+
+
+class _PerLoopAsyncTransport(httpx.AsyncBaseTransport):
+    """
+    Async connection pools are bound to the event loop that opened them, so
+    keep one pooled transport per running loop. The API server has a single
+    loop; CLI runs and tests that call asyncio.run repeatedly get a fresh pool
+    instead of reusing sockets from a closed loop.
+    """
+
+    def __init__(self, limits: httpx.Limits) -> None:
+        self._limits = limits
+        self._transports: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, httpx.AsyncHTTPTransport
+        ] = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def _loop_transport(self) -> httpx.AsyncHTTPTransport:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            transport = self._transports.get(loop)
+            if transport is None:
+                transport = httpx.AsyncHTTPTransport(limits=self._limits)
+                self._transports[loop] = transport
+            return transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._loop_transport().handle_async_request(request)
+
+    async def aclose(self) -> None:
+        with self._lock:
+            transport = self._transports.pop(asyncio.get_running_loop(), None)
+        if transport is not None:
+            await transport.aclose()
+
+
+@lru_cache(maxsize=1)
+def get_async_http_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=_PerLoopAsyncTransport(_HTTP_LIMITS))
+
+
+@lru_cache(maxsize=16)
+def get_chat_model(model: str, temperature: float) -> ChatOpenAI:
+    """Return a shared ChatOpenAI for (model, temperature) on the pooled clients."""
+    return ChatOpenAI(
+        model=model,
+        temperature=temperature,
+        http_client=get_http_client(),
+        http_async_client=get_async_http_client(),
+    )
+
+
+async def warm_llm_connection_pool(timeout: float = 3.0) -> None:
+    """
+    Open a keep-alive connection to the model provider on the shared async
+    client, so the first agent turn after startup skips DNS and TLS setup.
+
+    The request is an unauthenticated GET; the 401 it gets back still leaves
+    a pooled connection behind without spending a completion.
+    """
+    base_url = (
+        os.getenv("OPENAI_BASE_URL")
+        or os.getenv("OPENAI_API_BASE")
+        or "https://api.openai.com/v1"
+    )
+    try:
+        await get_async_http_client().get(
+            f"{base_url.rstrip('/')}/models", timeout=timeout
+        )
+    except httpx.HTTPError as exc:
+        print(f"[Startup] LLM connection warmup failed: {exc}")
@@ -0,0 +1,21 @@
+import logging
+import os
+
+
+def parse_log_level(value: str | None) -> int:
+    """Parse PARTYHAT_LOG as a level name or number, defaulting to WARNING."""
+    value = (value or "").strip()
+    if value.isdigit():
+        return int(value)
+    level = logging.getLevelName(value.upper()) if value else logging.WARNING
+    return level if isinstance(level, int) else logging.WARNING
+
+
+def configure_logging() -> None:
+    """
+    Apply PARTYHAT_LOG to the partyhat.* loggers and make sure their records
+    reach stderr. Entry points call this once; if the host process already
+    configured root logging (uvicorn --log-config, pytest), that is kept.
+    """
+    logging.getLogger("partyhat").setLevel(parse_log_level(os.getenv("PARTYHAT_LOG")))
+    logging.basicConfig(format="%(message)s")
@@ -1,19 +1,20 @@
 import asyncio
+import hashlib
+import logging
 import os
-import sys
-import json
 import threading
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from functools import lru_cache
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import orjson
 
 from dotenv import load_dotenv
 from agents.contract_identity import normalize_plan_contracts
-from letta_client import Letta
+from letta_client import Letta, NotFoundError
 from agents.pipeline_specs import default_deployment_target_payload
-from agents.pipeline_context import extract_plan_summary
+from agents.pipeline_context import dumps_json, extract_plan_summary, loads_json
 from schemas.deployment_schema import DeploymentTarget
 
 try:
@@ -32,18 +33,37 @@ load_dotenv(
     os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".env")
 )
 
+
+# Per-call telemetry goes through logging so servers can silence it.
+# PARTYHAT_LOG=INFO shows block creation and unpersisted agent actions once an
+# entry point has called agents.log_config.configure_logging().
+logger = logging.getLogger("partyhat.memory")
+
+
+def _dumps(data) -> str:
+    return dumps_json(data, indent=True)
+
+
+_loads = loads_json
+
 _db_runtime_lock = threading.Lock()
 _db_loop_ready = threading.Event()
 _db_loop: asyncio.AbstractEventLoop | None = None
 _db_loop_thread: threading.Thread | None = None
 _db_async_engine = None
 _db_async_session_factory = None
+# Overlaps independent Neon/Letta round trips issued from sync callers.
+# save_plan waits on this pool while holding the planning state lock, so
+# work submitted here must never take an agent state lock itself.
+_io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="memory-io")
+# Speculative plan reads get their own workers for the same reason.
+_prefetch_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="memory-prefetch")
 _HOT_AGENT_STATE_DEFAULTS: dict[str, dict] = {
     "planning": {
-        "plan_id": None,
-        "plan_status": None,
+        "plan_id": None,  # Neon plans.id
+        "plan_status": None,  # draft | ready | generating | testing | deployed
         "plan_summary": {},
-        "note_count": 0,
+        "note_count": 0,  # how many reasoning notes exist in Neon
         "current_plan": None,
         "approval_request": None,
     },
@@ -55,8 +75,8 @@ _HOT_AGENT_STATE_DEFAULTS: dict[str, dict] = {
         "notes": [],
     },
     "testing": {
-        "last_test_status": None,
-        "last_run_id": None,
+        "last_test_status": None,  # passed | failed | error
+        "last_run_id": None,  # Neon test_runs.id
         "last_run": None,
         "last_test_results": [],
         "artifacts": [],
@@ -81,6 +101,11 @@ _HOT_AGENT_STATE_DEFAULTS: dict[str, dict] = {
         "reports": [],
     },
 }
+# Encoded once so each fresh copy of a template is a single decode.
+_HOT_AGENT_STATE_DEFAULTS_JSON: dict[str, bytes] = {
+    agent_name: orjson.dumps(template)
+    for agent_name, template in _HOT_AGENT_STATE_DEFAULTS.items()
+}
 
 
 def _db_loop_worker() -> None:
@@ -157,8 +182,88 @@ def _get_letta_client(api_key: str | None):
     return Letta(api_key=api_key)
 
 
+# Upper bound on persisted label -> block ID entries; oldest are dropped first.
+_MAX_PERSISTED_BLOCK_IDS = 1024
+_persisted_block_ids: dict[str, dict[str, str]] = {}
+_persisted_block_ids_lock = threading.Lock()
+
+
+def _block_id_cache_path(client, api_key: str | None) -> str:
+    """
+    Block IDs are only meaningful to the Letta server and account that issued
+    them, so each base URL / API key pair gets its own cache file.
+    """
+    cache_dir = os.getenv("PARTYHAT_CACHE_DIR") or os.path.join(
+        os.path.expanduser("~"), ".partyhat"
+    )
+    account = f"{getattr(client, 'base_url', '')}|{api_key or ''}"
+    digest = hashlib.sha256(account.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(cache_dir, f"letta_block_ids.{digest}.json")
+
+
+def _read_block_id_file(path: str) -> dict[str, str]:
+    try:
+        with open(path, "rb") as fh:
+            data = _loads(fh.read())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    return {str(label): str(block_id) for label, block_id in data.items()}
+
+
+def _load_persisted_block_ids(path: str) -> dict[str, str]:
+    """Label -> block ID mappings resolved by earlier processes, read once."""
+    with _persisted_block_ids_lock:
+        ids = _persisted_block_ids.get(path)
+        if ids is None:
+            ids = _persisted_block_ids[path] = _read_block_id_file(path)
+        return ids
+
+
+def _write_block_ids(path: str, updates: dict[str, str | None]) -> None:
+    """
+    Best-effort merge of ``updates`` into the cache file (None drops a label).
+    The file is re-read first so entries written by other workers survive,
+    then replaced atomically.
+    """
+    with _persisted_block_ids_lock:
+        ids = _read_block_id_file(path)
+        for label, block_id in updates.items():
+            ids.pop(label, None)
+            if block_id is not None:
+                ids[label] = block_id
+        while len(ids) > _MAX_PERSISTED_BLOCK_IDS:
+            ids.pop(next(iter(ids)))
+        _persisted_block_ids[path] = ids
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as fh:
+                fh.write(orjson.dumps(ids))
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+
+def _persist_block_id(path: str, label: str, block_id: str) -> None:
+    """Record a resolved block ID so restarts skip blocks.list()."""
+    if _load_persisted_block_ids(path).get(label) == block_id:
+        return
+    _write_block_ids(path, {label: block_id})
+
+
+def _forget_block_id(path: str, label: str) -> None:
+    if label in _load_persisted_block_ids(path):
+        _write_block_ids(path, {label: None})
+
+
 class MemoryManager:
     _block_id_cache_global: dict[str, str] = {}
+    # Tool calls from one model turn run concurrently, so read-modify-write
+    # updates of an agent slice share one lock per scope across instances.
+    _agent_state_locks: dict[tuple[str, str], threading.RLock] = {}
+    _agent_state_locks_guard = threading.Lock()
 
     def __init__(self, user_id: str = "default", project_id: str | None = None):
         """
@@ -167,15 +272,19 @@ class MemoryManager:
                         Defaults to "default" for local testing only.
             project_id: When set, all memory is scoped to this project.
         """
-        self.client = _get_letta_client(os.getenv("LETTA_API_KEY"))
+        api_key = os.getenv("LETTA_API_KEY")
+        self.client = _get_letta_client(api_key)
+        self._block_id_cache_path = _block_id_cache_path(self.client, api_key)
         self.user_id = user_id
         self.project_id = project_id
 
         # Block labels
         if project_id:
             self.user_block_label = f"project:{project_id}"
+            self.global_block_label = f"project:{project_id}:agent_log"
         else:
             self.user_block_label = f"user:{user_id}"
+            self.global_block_label = "global_agent_log"
 
         # Block ID cache that are populated on first _get_or_create call
         # Avoids repeated blocks.list() calls within the same instance
@@ -184,13 +293,25 @@ class MemoryManager:
         # DB available flag: False if DATABASE_URL is not set
         self._db_available = bool(os.getenv("DATABASE_URL"))
 
+    def agent_state_lock(self, agent_name: str) -> threading.RLock:
+        """
+        Lock to hold around a get_agent_state/set_agent_state pair so that
+        concurrent updates of the same slice do not overwrite each other.
+        """
+        key = (self.user_block_label, agent_name)
+        with self._agent_state_locks_guard:
+            lock = self._agent_state_locks.get(key)
+            if lock is None:
+                lock = self._agent_state_locks[key] = threading.RLock()
+            return lock
+
     def _serialize(self, data: dict) -> str:
         if toon_encode is not None:
             try:
                 return toon_encode(data)
             except Exception:
-                return json.dumps(data, indent=2)
-        return json.dumps(data, indent=2)
+                return _dumps(data)
+        return _dumps(data)
 
     def _deserialize(self, value: str) -> dict:
         if not value:
@@ -205,44 +326,64 @@ class MemoryManager:
                 except Exception:
                     pass
                 try:
-                    return json.loads(value)
+                    return _loads(value)
                 except Exception:
                     pass
-        return json.loads(value)
+        return _loads(value)
 
-    def _get_or_create_block(
-        self, label: str, initial_value: dict, limit: int
-    ) -> object:
+    def _find_block(self, label: str) -> object | None:
         """
-        Get or create a Letta block by label.
+        Look up an existing Letta block by label, or return None.
         Caches the block ID after the first lookup so subsequent calls
-        skip blocks.list() entirely.
+        skip blocks.list() entirely. Resolved IDs are also persisted to a
+        local cache file so a fresh process starts with a point lookup.
         """
+        if label not in self._block_id_cache:
+            persisted_id = _load_persisted_block_ids(self._block_id_cache_path).get(
+                label
+            )
+            if persisted_id:
+                self._block_id_cache[label] = persisted_id
+
         # Returning cached block ID if we have it
         if label in self._block_id_cache:
             # We still need the block object for its value so fetch directly
             # This is a single GET by ID, not a full list scan
             try:
-                return self.client.blocks.get(self._block_id_cache[label])
-            except Exception:
-                # Cache miss: block may have been deleted, fall through to list
-                del self._block_id_cache[label]
-
-        # First call: scan the list once
-        existing = self.client.blocks.list()
+                return self.client.blocks.retrieve(self._block_id_cache[label])
+            except NotFoundError:
+                # Block was deleted; drop the stale ID and fall through to list.
+                # Transient errors propagate so they don't trigger a full scan.
+                self._block_id_cache.pop(label, None)
+                _forget_block_id(self._block_id_cache_path, label)
+
+        # First call: let Letta filter by label instead of paging through
+        # every block on the account; the label check guards older servers.
+        existing = self.client.blocks.list(label=label)
         for block in existing:
             if block.label == label:
                 self._block_id_cache[label] = block.id
+                _persist_block_id(self._block_id_cache_path, label, block.id)
                 return block
+        return None
+
+    def _get_or_create_block(
+        self, label: str, initial_value: dict, limit: int
+    ) -> object:
+        """Get or create a Letta block by label (see _find_block for caching)."""
+        block = self._find_block(label)
+        if block is not None:
+            return block
 
         # Block doesn't exist so create it
-        print(f"[MemoryManager] Creating block: {label}")
+        logger.info("[MemoryManager] Creating block: %s", label)
         block = self.client.blocks.create(
             label=label,
             value=self._serialize(initial_value),
             limit=limit,
         )
         self._block_id_cache[label] = block.id
+        _persist_block_id(self._block_id_cache_path, label, block.id)
         return block
 
     def _get_or_create_user_block(self):
@@ -263,33 +404,8 @@ class MemoryManager:
             },
             # Per-agent working state: pointers and lightweight state
             "agents": {
-                "planning": {
-                    "plan_id": None,  # Neon plans.id
-                    "plan_status": None,  # draft | ready | generating | testing | deployed
-                    "plan_summary": {},
-                    "note_count": 0,  # how many reasoning notes exist in Neon
-                    "current_plan": None,
-                },
-                "coding": {
-                    "artifact_count": 0,
-                    "last_artifact_path": None,
-                    "latest_artifact_revision": 0,
-                },
-                "testing": {
-                    "last_test_status": None,  # passed | failed | error
-                    "last_run_id": None,  # Neon test_runs.id
-                    "last_run": None,
-                },
-                "deployment": {
-                    "last_deploy_status": None,
-                    "last_deploy_ref": None,
-                    "deployed_address": None,
-                    "tx_hash": None,
-                    "snowtrace_url": None,
-                },
-                "audit": {
-                    "open_issues": 0,
-                },
+                agent_name: self._default_agent_state(agent_name)
+                for agent_name in _HOT_AGENT_STATE_DEFAULTS
             },
         }
         # 10k as limit for this lean structure
@@ -300,6 +416,17 @@ class MemoryManager:
         block = self._get_or_create_user_block()
         return self._deserialize(block.value), block
 
+    def _read_global_block(self):
+        """
+        Read the legacy agent-log block for debugging. Returns (data dict,
+        block object or None). The log itself now lives in Neon, so this never
+        creates the block; repeat reads go straight to the cached block ID.
+        """
+        block = self._find_block(self.global_block_label)
+        if block is None:
+            return {}, None
+        return self._deserialize(block.value), block
+
     def _write_user_block(self, data: dict, block) -> None:
         """Write updated data back to the user block using cached ID."""
         self.client.blocks.update(block.id, value=self._serialize(data))
@@ -319,44 +446,10 @@ class MemoryManager:
         tools like save_code_artifact can safely mutate coding/testing state.
         """
         agents = data.setdefault("agents", {})
-
-        planning = agents.setdefault("planning", {})
-        planning.setdefault("plan_id", None)
-        planning.setdefault("plan_status", None)
-        planning.setdefault("plan_summary", {})
-        planning.setdefault("note_count", 0)
-        planning.setdefault("current_plan", None)
-
-        coding = agents.setdefault("coding", {})
-        coding.setdefault("artifact_count", 0)
-        coding.setdefault("last_artifact_path", None)
-        coding.setdefault("latest_artifact_revision", 0)
-        coding.setdefault("artifacts", [])
-        coding.setdefault("notes", [])
-
-        testing = agents.setdefault("testing", {})
-        testing.setdefault("last_test_status", None)
-        testing.setdefault("last_run_id", None)
-        testing.setdefault("last_run", None)
-        testing.setdefault("last_test_results", [])
-        testing.setdefault("artifacts", [])
-        testing.setdefault("notes", [])
-
-        deployment = agents.setdefault("deployment", {})
-        deployment.setdefault("last_deploy_status", None)
-        deployment.setdefault("last_deploy_ref", None)
-        deployment.setdefault("deployed_address", None)
-        deployment.setdefault("tx_hash", None)
-        deployment.setdefault("snowtrace_url", None)
-        deployment.setdefault("deployed_contracts", [])
-        deployment.setdefault("executed_calls", [])
-        deployment.setdefault("last_deploy_results", [])
-        deployment.setdefault("artifacts", [])
-        deployment.setdefault("targets", [])
-        deployment.setdefault("deployments", [])
-
-        audit = agents.setdefault("audit", {})
-        audit.setdefault("open_issues", 0)
+        for agent_name in _HOT_AGENT_STATE_DEFAULTS:
+            agent_state = agents.setdefault(agent_name, {})
+            for key, value in self._default_agent_state(agent_name).items():
+                agent_state.setdefault(key, value)
 
     def _project_uuid(self) -> uuid.UUID | None:
         """Return project_id as UUID, or None if not set / not a valid UUID."""
@@ -375,8 +468,8 @@ class MemoryManager:
         )
 
     def _default_agent_state(self, agent_name: str) -> dict:
-        template = _HOT_AGENT_STATE_DEFAULTS.get(agent_name, {})
-        return json.loads(json.dumps(template))
+        encoded = _HOT_AGENT_STATE_DEFAULTS_JSON.get(agent_name)
+        return _loads(encoded) if encoded is not None else {}
 
     def _normalize_agent_state(self, agent_name: str, state: dict | None) -> dict:
         normalized = self._default_agent_state(agent_name)
@@ -454,10 +547,10 @@ class MemoryManager:
         try:
             return _run_db(_run())
         except Exception as e:
-            print(f"[MemoryManager] DB error: {e}")
+            logger.warning("[MemoryManager] DB error: %s", e)
             return None
 
-    def save_plan(self, plan: dict) -> None:
+    def save_plan(self, plan: dict, previous_plan: dict | None = None) -> None:
         """
         Save the smart contract plan.
         Full plan JSON → Neon plans table.
@@ -465,41 +558,54 @@ class MemoryManager:
           - plan_id + status pointers
           - a copy of the current plan JSON
           - a copy of the previous plan JSON (one-step history only)
+
+        Callers that already hold the stored plan (read-modify-write flows)
+        can pass it as previous_plan to skip a second get_plan() round trip.
         """
-        try:
-            previous_plan = self.get_plan()
-        except Exception:
-            previous_plan = None
+        if previous_plan is None:
+            try:
+                # The save below rewrites the plan and its summary, so the
+                # read skips get_plan's repair and summary write-backs.
+                previous_plan = self._read_plan(write_back=False)
+            except Exception:
+                previous_plan = None
         plan = self._normalize_plan_payload(plan, previous_plan=previous_plan)
         project_uuid = self._project_uuid()
         status = plan.get("status", "draft")
 
-        # Writing the full plan to Neon
-        saved_plan = None
+        # Writing the full plan to Neon; the upsert does not depend on the
+        # planning state, so it runs while that state is read.
+        saved_plan_future = None
         if project_uuid:
             from agents.db.crud import upsert_plan as db_upsert_plan
 
-            saved_plan = self._db_call(
-                lambda session: db_upsert_plan(session, project_uuid, plan, status)
+            saved_plan_future = _io_pool.submit(
+                self._db_call,
+                lambda session: db_upsert_plan(session, project_uuid, plan, status),
             )
 
         compact_summary = extract_plan_summary(plan)
-        planning = self.get_agent_state("planning")
-        planning["plan_status"] = status
-        planning["plan_summary"] = compact_summary
-        if saved_plan:
-            planning["plan_id"] = str(saved_plan.id)
-            planning["current_plan"] = None
-        else:
-            planning["current_plan"] = plan
-        self.set_agent_state("planning", planning)
+        with self.agent_state_lock("planning"):
+            try:
+                planning = self.get_agent_state("planning")
+            finally:
+                saved_plan = saved_plan_future.result() if saved_plan_future else None
+            planning["plan_status"] = status
+            planning["plan_summary"] = compact_summary
+            if saved_plan:
+                planning["plan_id"] = str(saved_plan.id)
+                planning["current_plan"] = None
+            else:
+                planning["current_plan"] = plan
+            self.set_agent_state("planning", planning)
 
     def _sync_plan_summary(self, plan: dict) -> None:
         summary = extract_plan_summary(plan)
-        planning = self.get_agent_state("planning")
-        if planning.get("plan_summary") != summary:
-            planning["plan_summary"] = summary
-            self.set_agent_state("planning", planning)
+        with self.agent_state_lock("planning"):
+            planning = self.get_agent_state("planning")
+            if planning.get("plan_summary") != summary:
+                planning["plan_summary"] = summary
+                self.set_agent_state("planning", planning)
 
     def get_plan(self) -> dict | None:
         """
@@ -507,6 +613,13 @@ class MemoryManager:
         Reads from Neon if available, falls back to Letta copy when Neon is
         unavailable or has no row.
         """
+        return self._read_plan(write_back=True)
+
+    def _read_plan(self, *, write_back: bool) -> dict | None:
+        """
+        Load and normalise the stored plan. With write_back, a normalised
+        legacy plan is persisted and the Letta plan summary is re-synced.
+        """
         project_uuid = self._project_uuid()
 
         if project_uuid and self._db_available:
@@ -516,6 +629,8 @@ class MemoryManager:
             plan_row = self._db_call(lambda session: db_get_plan(session, project_uuid))
             if plan_row and getattr(plan_row, "plan_data", None) is not None:
                 normalized = self._normalize_plan_payload(plan_row.plan_data)
+                if not write_back:
+                    return normalized
                 if normalized != plan_row.plan_data:
                     self._db_call(
                         lambda session: db_upsert_plan(
@@ -529,17 +644,36 @@ class MemoryManager:
                 return normalized
 
         # Fallback: read from Letta planning slice (current_plan).
-        planning = self.get_agent_state("planning")
-        plan = planning.get("current_plan") or None
-        if not isinstance(plan, dict):
-            return plan
-        normalized = self._normalize_plan_payload(plan)
-        if normalized != plan:
-            planning["current_plan"] = normalized
-            self.set_agent_state("planning", planning)
+        with self.agent_state_lock("planning"):
+            planning = self.get_agent_state("planning")
+            plan = planning.get("current_plan") or None
+            if not isinstance(plan, dict):
+                return plan
+            normalized = self._normalize_plan_payload(plan)
+            if not write_back:
+                return normalized
+            if normalized != plan:
+                planning["current_plan"] = normalized
+                self.set_agent_state("planning", planning)
         self._sync_plan_summary(normalized)
         return normalized
 
+    def prefetch_plan(self) -> Future:
+        """
+        Start a read-only plan load in the background. It skips get_plan's
+        repair and summary write-backs, so a prefetch that is discarded or
+        outlives a newer save can never overwrite fresher state.
+        """
+        return _prefetch_pool.submit(self._read_plan, write_back=False)
+
+    async def aget_plan(self) -> dict | None:
+        """get_plan for async callers; the Letta/Neon reads run off the event loop."""
+        return await asyncio.to_thread(self.get_plan)
+
+    async def asave_plan(self, plan: dict, previous_plan: dict | None = None) -> None:
+        """save_plan for async callers; the Letta/Neon writes run off the event loop."""
+        await asyncio.to_thread(self.save_plan, plan, previous_plan)
+
     def get_plan_history(self) -> list:
         """Plan history is no longer stored; return empty list."""
         return []
@@ -558,9 +692,10 @@ class MemoryManager:
                 lambda session: db_update_status(session, project_uuid, status)
             )
 
-        planning = self.get_agent_state("planning")
-        planning["plan_status"] = status
-        self.set_agent_state("planning", planning)
+        with self.agent_state_lock("planning"):
+            planning = self.get_agent_state("planning")
+            planning["plan_status"] = status
+            self.set_agent_state("planning", planning)
 
     def save_reasoning_note(self, note: str) -> None:
         """
@@ -568,16 +703,26 @@ class MemoryManager:
         Full note → Neon reasoning_notes table.
         Letta block updated with note_count pointer only.
         """
+        self.save_reasoning_notes([note])
+
+    def save_reasoning_notes(self, notes: list[str]) -> None:
+        """
+        Save several planning reasoning notes at once.
+        One Neon commit and one Letta note_count update for the whole batch.
+        """
+        if not notes:
+            return
         project_uuid = self._project_uuid()
 
         if project_uuid and self._db_available:
-            from agents.db.crud import add_reasoning_note as db_add_note
+            from agents.db.crud import add_reasoning_notes as db_add_notes
 
-            self._db_call(lambda session: db_add_note(session, project_uuid, note))
+            self._db_call(lambda session: db_add_notes(session, project_uuid, notes))
 
-        planning = self.get_agent_state("planning")
-        planning["note_count"] = planning.get("note_count", 0) + 1
-        self.set_agent_state("planning", planning)
+        with self.agent_state_lock("planning"):
+            planning = self.get_agent_state("planning")
+            planning["note_count"] = planning.get("note_count", 0) + len(notes)
+            self.set_agent_state("planning", planning)
 
     def get_reasoning_notes(self) -> list:
         """
@@ -621,7 +766,7 @@ class MemoryManager:
         """
         project_uuid = self._project_uuid()
         if not project_uuid or not self._db_available:
-            print(f"[AgentLog] {agent_name} | {action} | {why or ''}")
+            logger.info("[AgentLog] %s | %s | %s", agent_name, action, why or "")
             return
 
         # Building a lean summary from decisions_made and how
@@ -1109,7 +1254,10 @@ class MemoryManager:
         normalized = normalize_plan_contracts(plan, previous_plan=previous_plan)
         if not isinstance(normalized, dict):
             return normalized
-        normalized.setdefault("deployment_target", default_deployment_target_payload())
+        if normalized.get("deployment_target") is None:
+            # The default payload is already canonical; skip revalidating it.
+            normalized["deployment_target"] = default_deployment_target_payload()
+            return normalized
         try:
             normalized["deployment_target"] = DeploymentTarget.model_validate(
                 normalized["deployment_target"]
@@ -1119,7 +1267,22 @@ class MemoryManager:
         return normalized
 
 
+@lru_cache(maxsize=256)
+def get_memory_manager(
+    user_id: str = "default", project_id: str | None = None
+) -> MemoryManager:
+    """
+    Return the shared MemoryManager for a user/project scope.
+    Instances hold no per-call state, so request handlers can reuse one per
+    scope instead of rebuilding it (and re-reading env config) every request.
+    """
+    return MemoryManager(user_id=user_id, project_id=project_id)
+
+
 if __name__ == "__main__":
+    from agents.log_config import configure_logging
+
+    configure_logging()
     mm = MemoryManager(user_id="test-user-123")
     print("MemoryManager ready!")
     print(f"User block label: {mm.user_block_label}")
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from typing import Any
+import json
+import re
+from typing import Any, Callable
+
+import orjson
 
 from agents.contract_identity import extract_plan_contracts
 
@@ -16,27 +20,23 @@ def extract_plan_summary(plan: dict | None) -> dict:
             "key_constraints": [],
         }
 
-    contracts = plan.get("contracts") or []
-    plan_contracts = [
-        {
-            "plan_contract_id": entry.get("plan_contract_id"),
-            "name": entry.get("name"),
-            "deployment_role": entry.get("deployment_role"),
-            "deploy_order": entry.get("deploy_order"),
-        }
-        for entry in extract_plan_contracts(plan)
-    ]
-    contract_names = [
-        contract.get("name")
-        for contract in contracts
-        if isinstance(contract, dict) and contract.get("name")
-    ]
-
-    erc_templates = []
+    # One walk over the contracts; this runs on every plan save and read.
+    plan_contracts: list[dict] = []
+    contract_names: list[str] = []
+    erc_templates: list[str] = []
     constraints: list[str] = []
-    for contract in contracts:
-        if not isinstance(contract, dict):
-            continue
+    for entry in extract_plan_contracts(plan):
+        contract = entry["contract"]
+        plan_contracts.append(
+            {
+                "plan_contract_id": entry.get("plan_contract_id"),
+                "name": entry.get("name"),
+                "deployment_role": entry.get("deployment_role"),
+                "deploy_order": entry.get("deploy_order"),
+            }
+        )
+        if contract.get("name"):
+            contract_names.append(contract.get("name"))
         erc_template = contract.get("erc_template")
         if erc_template:
             erc_templates.append(str(erc_template))
@@ -128,6 +128,57 @@ def compact_execution_summary(exit_code: int, stdout: str, stderr: str) -> str:
     return f"exit_code={exit_code}: {first_line[:200]}"
 
 
+# 19+ digit runs may not fit in 64 bits (-2**63 - 1 already has 19 digits).
+_WIDE_INT_RE = re.compile(rb"\d{19,}")
+
+
+def loads_json(data: str | bytes) -> Any:
+    """
+    Decode JSON with orjson, except when the text may hold integers beyond
+    64 bits, which orjson would silently turn into floats.
+    """
+    raw = data.encode() if isinstance(data, str) else data
+    if _WIDE_INT_RE.search(raw):
+        return json.loads(raw)
+    return orjson.loads(raw)
+
+
+def dumps_json(
+    payload: Any,
+    *,
+    indent: bool = False,
+    sort_keys: bool = False,
+    default: Callable[[Any], Any] | None = None,
+) -> str:
+    """
+    Encode JSON with orjson, falling back to the stdlib for integers beyond
+    64 bits (uint256 amounts and ids), which orjson refuses to serialize.
+    """
+    option = orjson.OPT_NON_STR_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    try:
+        return orjson.dumps(payload, option=option, default=default).decode()
+    except orjson.JSONEncodeError as exc:
+        if "64-bit" not in str(exc):
+            raise
+    return json.dumps(
+        payload,
+        indent=2 if indent else None,
+        separators=None if indent else (",", ":"),
+        sort_keys=sort_keys,
+        ensure_ascii=False,
+        default=default,
+    )
+
+
+def format_prompt_json(payload: Any, *, sort_keys: bool = False) -> str:
+    """Pretty-print a payload for embedding in an agent/model prompt."""
+    return dumps_json(payload, indent=True, sort_keys=sort_keys)
+
+
 def duration_ms(start, end) -> int | None:
     if start is None or end is None:
         return None
@@ -1,4 +1,3 @@
-import json
 import uuid
 from datetime import datetime, timezone
 from typing import AsyncIterator
@@ -75,6 +74,7 @@ from agents.pipeline_context import (
     default_expected_outputs,
     duration_ms,
     extract_plan_summary,
+    format_prompt_json,
     standardize_task_context,
 )
 from agents.pipeline_specs import (
@@ -82,6 +82,7 @@ from agents.pipeline_specs import (
     EMERGENCY_TASK_FUSE,
     TERMINAL_SUCCESS_TASK_TYPES,
     VALID_AGENTS,
+    default_deployment_target,
     default_deployment_target_payload,
     retry_budget_for_key,
     retry_budget_key_for_task,
@@ -537,7 +538,11 @@ def _latest_deploy_script(snapshot: dict) -> str | None:
     return None
 
 
-def _should_retry_for_chainlink(text: str) -> bool:
+def _should_retry_for_chainlink(result: dict, text: str) -> bool:
+    # Successful runs never need the Chainlink retry, so skip lowering and
+    # scanning their (often large) forge output entirely.
+    if result.get("success"):
+        return False
     lowered = text.lower()
     return "chainlink" in lowered or "aggregatorv3interface" in lowered
 
@@ -810,7 +815,7 @@ async def _handle_testing_run(task, project_id: str, user_id: str, pipeline_run_
     else:
         combined_error = f"{result.get('stdout', '')}\n{result.get('stderr', '')}"
 
-    if _should_retry_for_chainlink(combined_error):
+    if _should_retry_for_chainlink(result, combined_error):
         events.append(
             {
                 "type": "tool_call",
@@ -1137,7 +1142,7 @@ async def _handle_prepare_script(task, project_id: str, user_id: str, pipeline_r
             contract_name=contract_name,
             script_name=script_name,
             constraints=_deployment_constraints(None),
-            plan_summary=json.dumps(_current_plan_summary(mm, task.context), indent=2),
+            plan_summary=format_prompt_json(_current_plan_summary(mm, task.context)),
             contract_sources=_load_contract_sources(
                 snapshot.get("coding", []),
                 target_plan_contract_ids=all_manifest_contract_ids,
@@ -1344,10 +1349,12 @@ async def _handle_execute_deploy(task, project_id: str, user_id: str, pipeline_r
         return events
 
     manifest, _ = load_saved_manifest(project_id)
-    target = DeploymentTarget.model_validate(
-        manifest.deployment_target.model_dump()
+    # The manifest was validated on load; reuse its target instead of
+    # dumping and revalidating it.
+    target = (
+        manifest.deployment_target
         if manifest is not None
-        else default_deployment_target_payload()
+        else default_deployment_target()
     )
     target_payload = target.model_dump()
 
@@ -1369,7 +1376,7 @@ async def _handle_execute_deploy(task, project_id: str, user_id: str, pipeline_r
         f"{deploy_result.get('stdout', '')}\n"
         f"{deploy_result.get('stderr', '')}"
     )
-    if _should_retry_for_chainlink(combined):
+    if _should_retry_for_chainlink(deploy_result, combined):
         events.append(
             {
                 "type": "tool_call",
@@ -2046,7 +2053,7 @@ async def run_autonomous_pipeline(
                     agent_message = (
                         f"{task.description}\n\n"
                         "Pipeline task context:\n"
-                        f"{json.dumps(slim_context, indent=2, sort_keys=True)}"
+                        f"{format_prompt_json(slim_context, sort_keys=True)}"
                     )
                 with start_span(
                     "model.call",
@@ -67,8 +67,12 @@ def default_deployment_target() -> DeploymentTarget:
     )
 
 
+# The default target never changes, so dump it once and hand out copies.
+_DEFAULT_DEPLOYMENT_TARGET_PAYLOAD = default_deployment_target().model_dump()
+
+
 def default_deployment_target_payload() -> dict:
-    return default_deployment_target().model_dump()
+    return dict(_DEFAULT_DEPLOYMENT_TARGET_PAYLOAD)
 
 
 def retry_budget_key_for_task(task_type: str) -> str:
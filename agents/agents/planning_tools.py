@@ -10,27 +10,129 @@ Tools defined here:
     6. validate_plan: to run Pydantic schema check explicitly
     7. publish_final_plan: to finalise and save to user + global memory
     8. save_reasoning_note: to log WHY a decision was made (episodic memory)
+    9. save_reasoning_notes: to log several decisions in one write
 """
 
-import sys
-import os
+import asyncio
+import logging
+from concurrent.futures import Future
+from contextvars import ContextVar, Token
 from typing import List, Optional
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from langchain_core.tools import tool
 from pydantic import BaseModel, Field
 from agents.deployment_manifest import validate_post_deploy_calls
 from schemas.plan_schema import SmartContractPlan, PlanStatus
 
+logger = logging.getLogger("partyhat.planning")
+
 
 def _get_memory_manager():
     """Lazy import to avoid circular dependencies. Uses project/user from context."""
-    from agents.memory_manager import MemoryManager
+    from agents.memory_manager import get_memory_manager
     from agents.context import get_project_context
 
     project_id, user_id = get_project_context()
-    return MemoryManager(user_id=user_id or "default", project_id=project_id)
+    return get_memory_manager(user_id=user_id or "default", project_id=project_id)
+
+
+# Plan read started alongside the first model call of a planning session.
+# get_current_plan consumes it once; plan writes discard it so it never
+# answers with a plan older than the draft the agent just saved.
+_plan_prefetch: ContextVar[dict | None] = ContextVar("plan_prefetch", default=None)
+
+
+def prefetch_current_plan() -> Token:
+    """
+    Start reading the current plan in the background for this context.
+    Pass the returned token to reset_plan_prefetch once the turn is over.
+    """
+    try:
+        mm = _get_memory_manager()
+    except Exception:
+        # Speculative only; the tool reports the failure if it is called.
+        return _plan_prefetch.set(None)
+    return _plan_prefetch.set({"future": mm.prefetch_plan()})
+
+
+def reset_plan_prefetch(token: Token) -> None:
+    _discard_plan_prefetch()
+    _plan_prefetch.reset(token)
+
+
+def _take_plan_prefetch() -> Future | None:
+    holder = _plan_prefetch.get()
+    return holder.pop("future", None) if holder else None
+
+
+def _discard_plan_prefetch() -> None:
+    future = _take_plan_prefetch()
+    if future is not None:
+        future.cancel()
+
+
+# Reasoning notes recorded during one agent turn. Turn runners open a batch
+# so every note from the turn lands in a single save_reasoning_notes write.
+_pending_notes: ContextVar[list[str] | None] = ContextVar("pending_notes", default=None)
+
+
+# Shielded end-of-turn flushes; held here so they are not garbage collected
+# while they finish after the turn that queued them was cancelled.
+_pending_flushes: set[asyncio.Future] = set()
+
+
+def _flush_reasoning_notes(notes: list[str]) -> None:
+    if not notes:
+        return
+    try:
+        _get_memory_manager().save_reasoning_notes(notes)
+    except Exception:
+        # The tools already answered the model, so keep the notes recoverable.
+        logger.exception(
+            "[Planning] Could not save %d reasoning note(s): %s", len(notes), notes
+        )
+
+
+class ReasoningNoteBatch:
+    """
+    Collect reasoning notes for one agent turn and save them on exit.
+    Use ``with`` from sync runners and ``async with`` from async runners.
+    """
+
+    def __enter__(self) -> "ReasoningNoteBatch":
+        self._token = _pending_notes.set([])
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        _flush_reasoning_notes(self._finish())
+
+    async def __aenter__(self) -> "ReasoningNoteBatch":
+        return self.__enter__()
+
+    async def __aexit__(self, *exc_info) -> None:
+        # A client leaving a stream cancels the turn; the notes it already
+        # queued are still written by the shielded flush.
+        flush = asyncio.ensure_future(
+            asyncio.to_thread(_flush_reasoning_notes, self._finish())
+        )
+        _pending_flushes.add(flush)
+        flush.add_done_callback(_pending_flushes.discard)
+        await asyncio.shield(flush)
+
+    def _finish(self) -> list[str]:
+        notes = _pending_notes.get() or []
+        _pending_notes.reset(self._token)
+        return notes
+
+
+def _record_reasoning_notes(notes: list[str]) -> bool:
+    """Queue notes on the active turn batch, or save them now. True if queued."""
+    pending = _pending_notes.get()
+    if pending is None:
+        _get_memory_manager().save_reasoning_notes(notes)
+        return False
+    pending.extend(notes)
+    return True
 
 
 class AnswerRecommendation(BaseModel):
@@ -72,6 +174,9 @@ class PlanApprovalRequest(BaseModel):
     )
 
 
+_PLAN_APPROVAL_REQUEST = PlanApprovalRequest().model_dump()
+
+
 @tool
 def get_current_plan() -> dict:
     """
@@ -86,8 +191,11 @@ def get_current_plan() -> dict:
     Returns the plan as a dict, or an empty dict if no plan exists yet.
     """
     try:
-        mm = _get_memory_manager()
-        plan = mm.get_plan()
+        prefetched = _take_plan_prefetch()
+        if prefetched is not None:
+            plan = prefetched.result()
+        else:
+            plan = _get_memory_manager().get_plan()
         if plan:
             return plan
         return {"message": "No plan exists yet. This is a fresh start."}
@@ -149,10 +257,11 @@ def clear_answer_recommendations() -> None:
     """
     try:
         mm = _get_memory_manager()
-        state = mm.get_agent_state("planning")
-        if state.get("answer_recommendations"):
-            state["answer_recommendations"] = []
-            mm.set_agent_state("planning", state)
+        with mm.agent_state_lock("planning"):
+            state = mm.get_agent_state("planning")
+            if state.get("answer_recommendations"):
+                state["answer_recommendations"] = []
+                mm.set_agent_state("planning", state)
     except Exception:
         # Best-effort cleanup; failures should never block planning flow.
         pass
@@ -164,19 +273,20 @@ def clear_pending_questions() -> None:
     """
     try:
         mm = _get_memory_manager()
-        state = mm.get_agent_state("planning")
-        updated = False
-        if state.get("pending_questions"):
-            state["pending_questions"] = []
-            updated = True
-        if state.get("answer_recommendations"):
-            state["answer_recommendations"] = []
-            updated = True
-        if state.get("approval_request"):
-            state["approval_request"] = None
-            updated = True
-        if updated:
-            mm.set_agent_state("planning", state)
+        with mm.agent_state_lock("planning"):
+            state = mm.get_agent_state("planning")
+            updated = False
+            if state.get("pending_questions"):
+                state["pending_questions"] = []
+                updated = True
+            if state.get("answer_recommendations"):
+                state["answer_recommendations"] = []
+                updated = True
+            if state.get("approval_request"):
+                state["approval_request"] = None
+                updated = True
+            if updated:
+                mm.set_agent_state("planning", state)
     except Exception:
         # Best-effort cleanup; failures should never block planning flow.
         pass
@@ -218,18 +328,23 @@ def _deployment_manifest_issues(plan: SmartContractPlan) -> List[str]:
         issues.append("deployment_target.private_key_env_var is required.")
 
     if len(plan.contracts) > 1:
-        primary = [c for c in plan.contracts if c.deployment_role == "primary_deployable"]
-        if len(primary) != 1:
+        primary_count = 0
+        deployable_count = 0
+        deploy_orders: List[int] = []
+        for contract in plan.contracts:
+            if contract.deployment_role == "primary_deployable":
+                primary_count += 1
+            if not contract.deployment_role or contract.deploy_order is None:
+                continue
+            deployable_count += 1
+            if contract.deploy_order:
+                deploy_orders.append(contract.deploy_order)
+
+        if primary_count != 1:
             issues.append(
                 "Multi-contract plans must mark exactly one contract as deployment_role='primary_deployable'."
             )
-
-        deploy_orders = [
-            c.deploy_order for c in plan.contracts if c.deployment_role and c.deploy_order
-        ]
-        if len(deploy_orders) != len(
-            [c for c in plan.contracts if c.deployment_role and c.deploy_order is not None]
-        ):
+        if len(deploy_orders) != deployable_count:
             issues.append(
                 "Every deployable contract in a multi-contract plan must define deploy_order."
             )
@@ -262,11 +377,12 @@ def save_plan_draft(plan: SmartContractPlan) -> dict:
     Returns a confirmation dict or an error dict.
     """
     try:
+        _discard_plan_prefetch()
         # Forcing status to draft for intermediate saves
         plan.status = PlanStatus.DRAFT
 
         mm = _get_memory_manager()
-        mm.save_plan(plan.model_dump())
+        mm.save_plan(plan.model_dump(mode="json"))
 
         # Logging to global audit trail
         mm.log_agent_action(
@@ -305,28 +421,29 @@ def send_question_batch(questions: List[PlanningQuestion]) -> dict:
 
     try:
         mm = _get_memory_manager()
-        state = mm.get_agent_state("planning")
-        state["pending_questions"] = []
-
-        for question in questions:
-            if len(question.answer_recommendations) > 5:
-                return {
-                    "error": (
-                        "Each planning question may contain at most 5 "
-                        "answer recommendations."
-                    )
-                }
-            state["pending_questions"].append(
-                question.model_dump(exclude_none=True)
-            )
+        with mm.agent_state_lock("planning"):
+            state = mm.get_agent_state("planning")
+            state["pending_questions"] = []
 
-        first_recommendations = (
-            questions[0].answer_recommendations if questions else []
-        )
-        state["answer_recommendations"] = [
-            rec.model_dump(exclude_none=True) for rec in first_recommendations
-        ]
-        mm.set_agent_state("planning", state)
+            for question in questions:
+                if len(question.answer_recommendations) > 5:
+                    return {
+                        "error": (
+                            "Each planning question may contain at most 5 "
+                            "answer recommendations."
+                        )
+                    }
+                state["pending_questions"].append(
+                    question.model_dump(exclude_none=True)
+                )
+
+            first_recommendations = (
+                questions[0].answer_recommendations if questions else []
+            )
+            state["answer_recommendations"] = [
+                rec.model_dump(exclude_none=True) for rec in first_recommendations
+            ]
+            mm.set_agent_state("planning", state)
 
         return {
             "success": True,
@@ -350,19 +467,20 @@ def send_answer_recommendations(recommendations: List[AnswerRecommendation]) ->
     """
     try:
         mm = _get_memory_manager()
-        state = mm.get_agent_state("planning")
-        state["answer_recommendations"] = [
-            rec.model_dump(exclude_none=True) for rec in recommendations
-        ]
-        if state.get("pending_questions") and isinstance(
-            state["pending_questions"], list
-        ):
-            first_question = state["pending_questions"][0]
-            if isinstance(first_question, dict):
-                first_question["answer_recommendations"] = state[
-                    "answer_recommendations"
-                ]
-        mm.set_agent_state("planning", state)
+        with mm.agent_state_lock("planning"):
+            state = mm.get_agent_state("planning")
+            state["answer_recommendations"] = [
+                rec.model_dump(exclude_none=True) for rec in recommendations
+            ]
+            if state.get("pending_questions") and isinstance(
+                state["pending_questions"], list
+            ):
+                first_question = state["pending_questions"][0]
+                if isinstance(first_question, dict):
+                    first_question["answer_recommendations"] = state[
+                        "answer_recommendations"
+                    ]
+            mm.set_agent_state("planning", state)
 
         return {
             "success": True,
@@ -383,10 +501,11 @@ def request_plan_verification() -> dict:
     """
     try:
         mm = _get_memory_manager()
-        state = mm.get_agent_state("planning")
-        approval_request = PlanApprovalRequest().model_dump()
-        state["approval_request"] = approval_request
-        mm.set_agent_state("planning", state)
+        with mm.agent_state_lock("planning"):
+            state = mm.get_agent_state("planning")
+            approval_request = dict(_PLAN_APPROVAL_REQUEST)
+            state["approval_request"] = approval_request
+            mm.set_agent_state("planning", state)
         return {
             "success": True,
             "approval_request": approval_request,
@@ -485,11 +604,12 @@ def publish_final_plan(plan: SmartContractPlan) -> dict:
                 "issues": issues,
             }
 
+        _discard_plan_prefetch()
         # Setting status to ready, it signals to Create agent it can start
         plan.status = PlanStatus.READY
 
         mm = _get_memory_manager()
-        mm.save_plan(plan.model_dump())
+        mm.save_plan(plan.model_dump(mode="json"))
 
         decisions = [
             f"Selected {c.erc_template or 'custom'} for contract {c.name}"
@@ -538,12 +658,12 @@ def save_reasoning_note(note: str) -> dict:
         note: A clear, concise plain English explanation of the decision
               and its rationale.
 
-    Returns confirmation dict.
+    Returns confirmation dict. Notes recorded during a chat turn are queued
+    and written together when the turn ends.
     """
     try:
-        mm = _get_memory_manager()
-        mm.save_reasoning_note(note)
-
+        if _record_reasoning_notes([note]):
+            return {"success": True, "note_queued": note}
         return {
             "success": True,
             "note_saved": note,
@@ -552,6 +672,35 @@ def save_reasoning_note(note: str) -> dict:
         return {"error": f"Could not save reasoning note: {str(e)}"}
 
 
+@tool
+def save_reasoning_notes(notes: List[str]) -> dict:
+    """
+    Save several decision notes from this planning turn in one write.
+
+    Use this instead of calling save_reasoning_note repeatedly when more than
+    one decision was made or clarified in the same turn. Each note follows
+    the same rules as save_reasoning_note.
+
+    Args:
+        notes: Plain English explanations, one per decision.
+
+    Returns confirmation dict. Notes recorded during a chat turn are queued
+    and written together when the turn ends.
+    """
+    notes = [note for note in notes if note and note.strip()]
+    if not notes:
+        return {"error": "Provide at least one non-empty note."}
+    try:
+        if _record_reasoning_notes(notes):
+            return {"success": True, "notes_queued": len(notes)}
+        return {
+            "success": True,
+            "notes_saved": len(notes),
+        }
+    except Exception as e:
+        return {"error": f"Could not save reasoning notes: {str(e)}"}
+
+
 # Default planning tools; MCP tools can be injected at runtime.
 _mcp_tools: List = []
 
@@ -564,6 +713,7 @@ PLANNING_TOOLS = [
     validate_plan,
     publish_final_plan,
     save_reasoning_note,
+    save_reasoning_notes,
 ]
 
 
@@ -571,7 +721,7 @@ async def load_planning_tools() -> List:
     """
     Async helper to load OpenZeppelin MCP tools via MultiServerMCPClient.
 
-    This should be called from an async context (e.g. FastAPI startup event),
+    This should be called from an async context (e.g. the FastAPI lifespan),
     not at import time.
     """
     try:
@@ -613,4 +763,5 @@ def set_planning_mcp_tools(tools: List) -> None:
         validate_plan,
         publish_final_plan,
         save_reasoning_note,
+        save_reasoning_notes,
     ]
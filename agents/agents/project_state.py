@@ -3,7 +3,7 @@ import json
 from typing import Any
 
 from agents.contract_identity import enrich_artifact_with_plan_contract_ids
-from agents.memory_manager import MemoryManager
+from agents.memory_manager import MemoryManager, get_memory_manager
 from schemas.plan_schema import PlanStatus
 
 
@@ -26,6 +26,8 @@ def compact_execution_history(
 
 
 def _stable_version(payload: dict[str, Any] | list[Any] | None) -> str:
+    # Kept on the stdlib encoder: clients hold these hashes across deploys,
+    # and it also handles uint256-sized integers.
     encoded = json.dumps(
         payload,
         sort_keys=True,
@@ -80,7 +82,7 @@ def get_project_state_versions(
     project_id: str | None,
     allow_recompute: bool = True,
 ) -> dict[str, str]:
-    mm = MemoryManager(user_id=user_id, project_id=project_id)
+    mm = get_memory_manager(user_id=user_id, project_id=project_id)
     versions = mm.get_project_state_versions()
     if any(value != "0" for value in versions.values()) or not allow_recompute:
         return versions
@@ -101,7 +103,7 @@ def get_project_state_resource(
     project_id: str | None,
     resource: str,
 ) -> dict[str, Any]:
-    mm = MemoryManager(user_id=user_id, project_id=project_id)
+    mm = get_memory_manager(user_id=user_id, project_id=project_id)
     versions = get_project_state_versions(user_id=user_id, project_id=project_id)
 
     if resource == "plan":
@@ -123,7 +125,7 @@ def get_project_state_snapshot(
     user_id: str,
     project_id: str | None,
 ) -> dict[str, Any]:
-    mm = MemoryManager(user_id=user_id, project_id=project_id)
+    mm = get_memory_manager(user_id=user_id, project_id=project_id)
     plan_state = get_plan_state(mm)
     code_state = get_code_state(mm, plan=plan_state.get("plan"))
     deployment_state = get_deployment_state(mm)
@@ -91,9 +91,9 @@ def _get_context():
 
 
 def _get_memory_manager(project_id: str | None, user_id: str | None):
-    from agents.memory_manager import MemoryManager
+    from agents.memory_manager import get_memory_manager
 
-    return MemoryManager(user_id=user_id or "default", project_id=project_id)
+    return get_memory_manager(user_id=user_id or "default", project_id=project_id)
 
 
 def _get_artifact_snapshot(project_id: str | None, user_id: str | None) -> dict:
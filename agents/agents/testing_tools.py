@@ -1,17 +1,13 @@
 import os
 import shlex
-import sys
 import threading
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from modal_foundry_app import foundry_image
 import modal
 from langchain_core.tools import tool
-from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage
 from pydantic import BaseModel, Field
 
@@ -39,16 +35,17 @@ from agents.modal_runtime import (
 from agents.pipeline_context import compact_execution_summary
 from agents.pipeline_cancel import is_pipeline_cancelled
 from agents.task_tools import TASK_TOOLS
+from agents.llm_clients import get_chat_model
 from agents.tracing import current_trace_id, start_span
 
 
 def _get_memory_manager():
     """Lazy import helper. Uses project/user from context."""
-    from agents.memory_manager import MemoryManager
+    from agents.memory_manager import get_memory_manager
     from agents.context import get_project_context
 
     project_id, user_id = get_project_context()
-    return MemoryManager(user_id=user_id or "default", project_id=project_id)
+    return get_memory_manager(user_id=user_id or "default", project_id=project_id)
 
 
 def _record_test_result(
@@ -249,7 +246,7 @@ def generate_foundry_tests_direct(
     )
 
     model_name = os.getenv("FOUNDRY_TEST_MODEL", "gpt-5.2-2025-12-11")
-    llm = ChatOpenAI(model=model_name, temperature=0.1)
+    llm = get_chat_model(model_name, 0.1)
 
     try:
         with start_span(
@@ -1,13 +1,10 @@
 import asyncio
-import json
 import uuid
 import os
-import sys
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from dotenv import load_dotenv
 from fastapi import Depends, FastAPI, HTTPException, Header, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -15,9 +12,9 @@ from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import Optional, List, Dict, Any
 
-from agents.planning_agent import build_planning_agent, chat
-from agents.agent_registry import chat_with_intent, stream_chat_with_intent
-from agents.memory_manager import MemoryManager
+from agents.planning_agent import achat, build_planning_agent
+from agents.agent_registry import achat_with_intent, stream_chat_with_intent
+from agents.memory_manager import get_memory_manager
 from agents.context import set_project_context, get_project_context
 from agents.db import get_session, create_tables, async_session_factory
 from agents.db.crud import (
@@ -38,7 +35,12 @@ from agents.db.crud import (
 )
 from agents.db.models import User, Project
 from schemas.plan_schema import PlanStatus
-from agents.planning_tools import load_planning_tools, set_planning_mcp_tools
+from agents.planning_tools import (
+    load_planning_tools,
+    prefetch_current_plan,
+    reset_plan_prefetch,
+    set_planning_mcp_tools,
+)
 from schemas.coding_schema import CodeGenerationRequest
 from agents.coding_tools import generate_solidity_code_direct
 from agents.code_storage import get_code_storage
@@ -76,13 +78,53 @@ from agents.telegram_service import (
     stop_notification_dispatcher,
 )
 from agents.tracing import configure_tracing
+from agents.log_config import configure_logging
+from agents.pipeline_context import dumps_json
+from agents.llm_clients import warm_llm_connection_pool
 
 load_dotenv()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Process startup/shutdown. OpenZeppelin MCP tools are injected into
+    PLANNING_TOOLS first, then the planning agent is built off the event loop
+    and the model provider connection is warmed, so the first planning
+    request pays for neither graph construction nor a TLS handshake.
+    """
+    configure_logging()
+    tools = await load_planning_tools()
+    set_planning_mcp_tools(tools)
+
+    await create_tables()
+    configure_tracing()
+
+    try:
+        webhook_result = await configure_telegram_webhook()
+        if webhook_result.get("configured") is False:
+            print(f"[Telegram] Webhook setup skipped: {webhook_result.get('reason')}")
+    except Exception as exc:
+        print(f"[Telegram] Webhook setup failed: {exc}")
+    await start_notification_dispatcher()
+
+    try:
+        await asyncio.to_thread(build_planning_agent)
+    except Exception as exc:
+        # Requests build it lazily again; startup should not fail on this.
+        print(f"[Startup] Planning agent prebuild failed: {exc}")
+    await warm_llm_connection_pool()
+    try:
+        yield
+    finally:
+        await stop_notification_dispatcher()
+
+
 app = FastAPI(
     title="PartyHat API",
     description="AI-powered smart contract planning agent",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 origins = [
@@ -102,43 +144,9 @@ app.add_middleware(
 )
 
 
-planning_agent = build_planning_agent()
 _ARTIFACT_TREE_CACHE: dict[tuple[str, str], Any] = {}
 
 
-@app.on_event("startup")
-async def load_mcp_tools_startup() -> None:
-    """
-    FastAPI startup hook to load OpenZeppelin MCP tools and inject them
-    into the global PLANNING_TOOLS used by the planning agent.
-    """
-    tools = await load_planning_tools()
-    set_planning_mcp_tools(tools)
-
-
-@app.on_event("startup")
-async def db_startup() -> None:
-    """Create Neon DB tables on startup."""
-    await create_tables()
-    configure_tracing()
-
-
-@app.on_event("startup")
-async def telegram_startup() -> None:
-    try:
-        webhook_result = await configure_telegram_webhook()
-        if webhook_result.get("configured") is False:
-            print(f"[Telegram] Webhook setup skipped: {webhook_result.get('reason')}")
-    except Exception as exc:
-        print(f"[Telegram] Webhook setup failed: {exc}")
-    await start_notification_dispatcher()
-
-
-@app.on_event("shutdown")
-async def telegram_shutdown() -> None:
-    await stop_notification_dispatcher()
-
-
 async def ensure_project_context(
     project_id: str,
     user_id: str,
@@ -799,12 +807,18 @@ async def start_session(
     await ensure_project_context(project_id, user_id, session)
 
     try:
-        result = chat(
-            agent=planning_agent,
-            session_id=session_id,
-            user_message="Hello, I want to plan a new smart contract.",
-            project_id=project_id if project_id != "default" else None,
-        )
+        # The planning prompt opens every conversation with get_current_plan,
+        # so read the plan while the first model call is generating.
+        prefetch_token = prefetch_current_plan()
+        try:
+            result = await achat(
+                agent=build_planning_agent(),
+                session_id=session_id,
+                user_message="Hello, I want to plan a new smart contract.",
+                project_id=project_id if project_id != "default" else None,
+            )
+        finally:
+            reset_plan_prefetch(prefetch_token)
         return StartSessionResponse(
             session_id=session_id,
             message=result["response"],
@@ -838,8 +852,8 @@ async def send_message(
             sender="user",
             content=request.message,
         )
-        result = chat(
-            agent=planning_agent,
+        result = await achat(
+            agent=build_planning_agent(),
             session_id=request.session_id,
             user_message=request.message,
             project_id=project_id if project_id != "default" else None,
@@ -862,6 +876,30 @@ async def send_message(
         raise HTTPException(status_code=500, detail=f"Agent error: {str(e)}")
 
 
+@app.post("/plan/message/stream")
+async def send_message_stream(
+    request: MessageRequest,
+    ctx: RequestContext = Depends(get_request_context),
+    session: AsyncSession | None = Depends(get_session),
+):
+    """
+    Streaming variant of /plan/message. Emits the same SSE events as
+    /agent/message/stream with intent "planning": reply "token" events as the
+    model generates them, a "step" per agent step and a final "done".
+    """
+    if not request.message.strip():
+        raise HTTPException(status_code=400, detail="Message cannot be empty")
+
+    return await _stream_chat_response(
+        intent="planning",
+        session_id=request.session_id,
+        message=request.message,
+        project_id=request.project_id or ctx.project_id,
+        user_id=request.user_id or ctx.user_id,
+        session=session,
+    )
+
+
 @app.get("/plan/current", response_model=PlanResponse)
 async def get_current_plan(
     project_id: str = "default",
@@ -873,13 +911,13 @@ async def get_current_plan(
     effective_user_id = user_id if user_id != "default" else ctx.user_id
     await ensure_project_context(effective_project_id, effective_user_id, session)
     try:
-        mm = MemoryManager(
+        mm = get_memory_manager(
             user_id=effective_user_id,
             project_id=(
                 effective_project_id if effective_project_id != "default" else None
             ),
         )
-        plan_state = get_plan_state(mm)
+        plan_state = await asyncio.to_thread(get_plan_state, mm)
         return PlanResponse(
             plan=plan_state["plan"],
             status=plan_state["status"],
@@ -905,7 +943,7 @@ async def get_current_code_artifacts(
     effective_user_id = user_id if user_id != "default" else ctx.user_id
     await ensure_project_context(effective_project_id, effective_user_id, session)
     try:
-        mm = MemoryManager(
+        mm = get_memory_manager(
             user_id=effective_user_id,
             project_id=(
                 effective_project_id if effective_project_id != "default" else None
@@ -935,7 +973,7 @@ async def get_current_deployment(
     effective_user_id = user_id if user_id != "default" else ctx.user_id
     await ensure_project_context(effective_project_id, effective_user_id, session)
     try:
-        mm = MemoryManager(
+        mm = get_memory_manager(
             user_id=effective_user_id,
             project_id=(
                 effective_project_id if effective_project_id != "default" else None
@@ -968,7 +1006,7 @@ async def get_current_test_results(
     effective_user_id = user_id if user_id != "default" else ctx.user_id
     await ensure_project_context(effective_project_id, effective_user_id, session)
     try:
-        mm = MemoryManager(
+        mm = get_memory_manager(
             user_id=effective_user_id,
             project_id=(
                 effective_project_id if effective_project_id != "default" else None
@@ -997,10 +1035,10 @@ async def approve_plan(
     await ensure_project_context(project_id, user_id, session)
 
     try:
-        mm = MemoryManager(
+        mm = get_memory_manager(
             user_id=user_id, project_id=project_id if project_id != "default" else None
         )
-        plan = mm.get_plan()
+        plan = await mm.aget_plan()
 
         if not plan:
             raise HTTPException(status_code=404, detail="No plan found to approve")
@@ -1011,8 +1049,9 @@ async def approve_plan(
                 detail="Contract is deployed on-chain and cannot be modified",
             )
 
-        plan["status"] = PlanStatus.READY.value
-        mm.save_plan(plan)
+        stored_plan = plan
+        plan = {**stored_plan, "status": PlanStatus.READY.value}
+        await mm.asave_plan(plan, previous_plan=stored_plan)
 
         return ApproveResponse(
             session_id=request.session_id,
@@ -1177,7 +1216,7 @@ async def get_full_memory_snapshot(
     await ensure_project_context(effective_project_id, effective_user_id, session)
 
     try:
-        mm = MemoryManager(
+        mm = get_memory_manager(
             user_id=effective_user_id,
             project_id=(
                 effective_project_id if effective_project_id != "default" else None
@@ -1226,7 +1265,7 @@ async def routed_message(
             sender="user",
             content=request.message,
         )
-        result = chat_with_intent(
+        result = await achat_with_intent(
             intent=request.intent,
             session_id=request.session_id,
             user_message=request.message,
@@ -1252,54 +1291,48 @@ async def routed_message(
         raise HTTPException(status_code=500, detail=f"Agent error: {str(e)}")
 
 
-@app.post("/agent/message/stream")
-async def routed_message_stream(
-    request: RoutedMessageRequest,
-    ctx: RequestContext = Depends(get_request_context),
-    session: AsyncSession | None = Depends(get_session),
-):
-    """
-    Stream agent responses and tool calls via Server-Sent Events.
-    Same request body as /agent/message; events are JSON objects with type:
-    "step" (content, tool_calls) and "done" (session_id, response, tool_calls,
-    plus planning-only UI metadata such as approval_request).
-    """
-    if not request.message.strip():
-        raise HTTPException(status_code=400, detail="Message cannot be empty")
-
-    project_id = request.project_id or ctx.project_id
-    user_id = request.user_id or ctx.user_id
+async def _stream_chat_response(
+    *,
+    intent: str,
+    session_id: str,
+    message: str,
+    project_id: str,
+    user_id: str,
+    session: AsyncSession | None,
+) -> StreamingResponse:
+    """Record the user message, then stream the agent turn as SSE events."""
     await ensure_project_context(project_id, user_id, session)
 
     project_uuid = _parse_project_uuid(project_id)
     await _append_chat_message(
         session=session,
         project_id=project_id,
-        session_id=request.session_id,
+        session_id=session_id,
         sender="user",
-        content=request.message,
+        content=message,
     )
 
     async def event_stream():
         try:
             async for event in stream_chat_with_intent(
-                intent=request.intent,
-                session_id=request.session_id,
-                user_message=request.message,
+                intent=intent,
+                session_id=session_id,
+                user_message=message,
                 project_id=project_id if project_id != "default" else None,
+                stream_tokens=True,
             ):
                 if event.get("type") == "done":
                     await _append_chat_message_new_session(
                         project_uuid=project_uuid,
-                        session_id=request.session_id,
+                        session_id=session_id,
                         sender="agent",
                         content=event.get("response", "") or "",
                     )
-                yield f"data: {json.dumps(event)}\n\n"
+                yield f"data: {_dumps_sse(event)}\n\n"
         except ValueError as e:
-            yield f"data: {json.dumps({'type': 'error', 'detail': str(e)})}\n\n"
+            yield f"data: {_dumps_sse({'type': 'error', 'detail': str(e)})}\n\n"
         except Exception as e:
-            yield f"data: {json.dumps({'type': 'error', 'detail': str(e)})}\n\n"
+            yield f"data: {_dumps_sse({'type': 'error', 'detail': str(e)})}\n\n"
 
     return StreamingResponse(
         event_stream(),
@@ -1312,6 +1345,32 @@ async def routed_message_stream(
     )
 
 
+@app.post("/agent/message/stream")
+async def routed_message_stream(
+    request: RoutedMessageRequest,
+    ctx: RequestContext = Depends(get_request_context),
+    session: AsyncSession | None = Depends(get_session),
+):
+    """
+    Stream agent responses and tool calls via Server-Sent Events.
+    Same request body as /agent/message; events are JSON objects with type:
+    "token" (content: the next piece of the reply text), "step" (content,
+    tool_calls) and "done" (session_id, response, tool_calls, plus
+    planning-only UI metadata such as approval_request).
+    """
+    if not request.message.strip():
+        raise HTTPException(status_code=400, detail="Message cannot be empty")
+
+    return await _stream_chat_response(
+        intent=request.intent,
+        session_id=request.session_id,
+        message=request.message,
+        project_id=request.project_id or ctx.project_id,
+        user_id=request.user_id or ctx.user_id,
+        session=session,
+    )
+
+
 @app.post("/coding/generate", response_model=CodeGenerationResponse)
 async def generate_solidity_endpoint(
     request: CodeGenerationRequest,
@@ -1372,6 +1431,10 @@ class GateDecisionRequest(BaseModel):
     reason: Optional[str] = None
 
 
+def _dumps_sse(payload: Any) -> str:
+    return dumps_json(payload, default=str)
+
+
 def _format_sse_event(
     event_type: str,
     payload: dict[str, Any],
@@ -1382,7 +1445,7 @@ def _format_sse_event(
     if event_id is not None:
         lines.append(f"id: {event_id}")
     lines.append(f"event: {event_type}")
-    lines.append(f"data: {json.dumps(payload)}")
+    lines.append(f"data: {_dumps_sse(payload)}")
     return "\n".join(lines) + "\n\n"
 
 
@@ -1418,8 +1481,8 @@ async def run_pipeline(
     await ensure_project_context(project_id, user_id, session)
 
     try:
-        mm = MemoryManager(user_id=user_id, project_id=project_id)
-        plan = mm.get_plan()
+        mm = get_memory_manager(user_id=user_id, project_id=project_id)
+        plan = await mm.aget_plan()
         print(f"Plan: {plan}")
         if not plan:
             raise HTTPException(
@@ -20,7 +20,7 @@ from letta_client import Letta
 
 def find_block_by_label(client: Letta, label: str):
     """Return the first Letta block matching the given label, or None."""
-    for block in client.blocks.list():
+    for block in client.blocks.list(label=label):
         if block.label == label:
             return block
     return None
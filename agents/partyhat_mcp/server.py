@@ -6,10 +6,10 @@ test, deploy, and audit Avalanche smart contracts.
 Usage:
     # Run standalone MCP server (stdio transport for local testing)
     cd partyhat/agents
-    uv run python mcp/server.py
+    uv run python -m partyhat_mcp.server
 
     # Run as HTTP SSE server (for remote agents over the network)
-    uv run python mcp/server.py --transport sse --port 8001
+    uv run python -m partyhat_mcp.server --transport sse --port 8001
 
 The MCP server runs on a separate port from the main FastAPI server (8000).
 Both can run simultaneously.
@@ -19,14 +19,10 @@ x402 payments:
     See partyhat_mcp/auth.py for pricing config and verification hook.
 """
 
-import os
-import sys
-
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from dotenv import load_dotenv
 from fastmcp import FastMCP
 
+from agents.log_config import configure_logging
 from partyhat_mcp.tools import (
     start_planning,
     generate_contract,
@@ -191,6 +187,7 @@ if __name__ == "__main__":
         help="Port for SSE transport (default: 8001)",
     )
     args = parser.parse_args()
+    configure_logging()
 
     if args.transport == "sse":
         print(f"Starting PartyHat MCP server (SSE) on port {args.port}...")
@@ -8,14 +8,10 @@ Tools:
 """
 
 import uuid
-import os
-import sys
-
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from agents.agent_registry import chat_with_intent
 from agents.context import set_project_context
-from agents.memory_manager import MemoryManager
+from agents.memory_manager import get_memory_manager
 from partyhat_mcp.auth import verify_payment
 
 
@@ -75,7 +71,7 @@ def start_planning(
     )
 
     # Reading the current plan status from memory
-    mm = MemoryManager(user_id=user_id, project_id=project_id)
+    mm = get_memory_manager(user_id=user_id, project_id=project_id)
     agent_state = mm.get_agent_state("planning")
     plan_status = agent_state.get("plan_status", "draft")
 
@@ -117,7 +113,7 @@ def generate_contract(
     _set_context(project_id, user_id)
 
     # Checking that the plan is ready before triggering coding
-    mm = MemoryManager(user_id=user_id, project_id=project_id)
+    mm = get_memory_manager(user_id=user_id, project_id=project_id)
     agent_state = mm.get_agent_state("planning")
     plan_status = agent_state.get("plan_status")
 
@@ -184,7 +180,7 @@ def run_tests(
         project_id=project_id,
     )
 
-    mm = MemoryManager(user_id=user_id, project_id=project_id)
+    mm = get_memory_manager(user_id=user_id, project_id=project_id)
     testing_state = mm.get_agent_state("testing")
 
     return {
@@ -224,7 +220,7 @@ def deploy_contract(
     _set_context(project_id, user_id)
 
     # Checking tests passed before deploying
-    mm = MemoryManager(user_id=user_id, project_id=project_id)
+    mm = get_memory_manager(user_id=user_id, project_id=project_id)
     testing_state = mm.get_agent_state("testing")
     last_test_status = testing_state.get("last_test_status")
 
@@ -293,7 +289,7 @@ def audit_contract(
         project_id=project_id,
     )
 
-    mm = MemoryManager(user_id=user_id, project_id=project_id)
+    mm = get_memory_manager(user_id=user_id, project_id=project_id)
     audit_state = mm.get_agent_state("audit")
 
     return {
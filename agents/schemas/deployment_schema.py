@@ -1,4 +1,5 @@
 from enum import Enum
+from functools import lru_cache
 import re
 from typing import Any, Optional, List
 
@@ -13,40 +14,56 @@ FUJI_RPC_ENV_VAR = "FUJI_RPC_URL"
 FUJI_PRIVATE_KEY_ENV_VAR = "FUJI_PRIVATE_KEY"
 
 
+_NETWORK_TOKEN_SEPARATOR_PATTERN = re.compile(r"[^a-z0-9]+")
+_FUJI_NETWORK_TOKENS = frozenset({FUJI_NETWORK, "fuji"})
+_AVALANCHE_NETWORK_TOKENS = frozenset({"avalanche", "avax"})
+
+
+@lru_cache(maxsize=256)
+def _network_token(value: str) -> str | None:
+    normalized = _NETWORK_TOKEN_SEPARATOR_PATTERN.sub("_", value.strip().lower())
+    return normalized.strip("_") or None
+
+
 def _normalize_network_token(value: Any) -> str | None:
     if not isinstance(value, str):
         return None
-    normalized = re.sub(r"[^a-z0-9]+", "_", value.strip().lower()).strip("_")
-    return normalized or None
+    return _network_token(value)
 
 
-def _coerce_fuji_target_payload(value: Any) -> Any:
-    if not isinstance(value, dict):
-        return value
+def _looks_like_fuji(payload: dict[str, Any]) -> bool:
+    # Cheap exact matches first: canonical targets round-tripped through
+    # model_dump() always hit one of these and skip token normalization.
+    if (
+        payload.get("network") == FUJI_NETWORK
+        or payload.get("chain_id") == FUJI_CHAIN_ID
+        or payload.get("rpc_url_env_var") == FUJI_RPC_ENV_VAR
+        or payload.get("private_key_env_var") == FUJI_PRIVATE_KEY_ENV_VAR
+    ):
+        return True
 
-    payload = dict(value)
     network_token = _normalize_network_token(payload.get("network"))
+    if network_token in _FUJI_NETWORK_TOKENS:
+        return True
     name_token = _normalize_network_token(payload.get("name"))
+    if name_token in _FUJI_NETWORK_TOKENS:
+        return True
+    if network_token in _AVALANCHE_NETWORK_TOKENS and name_token == "fuji":
+        return True
     description_token = _normalize_network_token(payload.get("description"))
-    chain_id = payload.get("chain_id")
-    rpc_url_env_var = payload.get("rpc_url_env_var")
-    private_key_env_var = payload.get("private_key_env_var")
-
-    looks_like_fuji = any(
-        [
-            network_token == FUJI_NETWORK,
-            network_token == "fuji",
-            network_token in {"avalanche", "avax"} and name_token == "fuji",
-            name_token in {FUJI_NETWORK, "fuji"},
-            description_token is not None
-            and "avalanche" in description_token
-            and "fuji" in description_token,
-            chain_id == FUJI_CHAIN_ID,
-            rpc_url_env_var == FUJI_RPC_ENV_VAR,
-            private_key_env_var == FUJI_PRIVATE_KEY_ENV_VAR,
-        ]
+    return (
+        description_token is not None
+        and "avalanche" in description_token
+        and "fuji" in description_token
     )
-    if not looks_like_fuji:
+
+
+def _coerce_fuji_target_payload(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+
+    payload = dict(value)
+    if not _looks_like_fuji(payload):
         return payload
 
     payload["network"] = FUJI_NETWORK
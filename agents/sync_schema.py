@@ -9,9 +9,6 @@ import asyncio
 import os
 import sys
 
-# Allow running from agents/ with agents package on path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -5,16 +5,40 @@ from agents import agent_registry, planning_tools
 
 
 class FakePlanningAgent:
-    def __init__(self, content: str, tool_calls: list[dict] | None = None):
+    def __init__(
+        self,
+        content: str,
+        tool_calls: list[dict] | None = None,
+        tokens: tuple[tuple[str, dict], ...] = (),
+    ):
         self._message = SimpleNamespace(
             content=content,
             tool_calls=tool_calls or [],
         )
+        self._tokens = tokens
 
-    async def astream(self, _payload, *, config, stream_mode):
+    async def astream_events(self, _payload, *, config, version, stream_mode):
         assert config == {"configurable": {"thread_id": "project-123"}}
+        assert version == "v2"
         assert stream_mode == "values"
-        yield {"messages": [self._message]}
+        for token, metadata in self._tokens:
+            yield {
+                "event": "on_chat_model_stream",
+                "metadata": metadata,
+                "parent_ids": ["root"],
+                "data": {"chunk": SimpleNamespace(content=token)},
+            }
+        # Node-level snapshots belong to nested runs and are not steps.
+        yield {
+            "event": "on_chain_stream",
+            "parent_ids": ["root"],
+            "data": {"chunk": {"messages": []}},
+        }
+        yield {
+            "event": "on_chain_stream",
+            "parent_ids": [],
+            "data": {"chunk": {"messages": [self._message]}},
+        }
 
 
 def test_stream_chat_with_intent_includes_approval_request_when_present(monkeypatch):
@@ -91,3 +115,125 @@ def test_stream_chat_with_intent_emits_null_approval_request_when_absent(monkeyp
 
     assert events[-1]["type"] == "done"
     assert events[-1]["approval_request"] is None
+
+
+def test_stream_chat_with_intent_streams_reply_tokens_when_requested(monkeypatch):
+    reply = {"langgraph_node": "model", "langgraph_checkpoint_ns": "model:1"}
+    subagent = {"langgraph_node": "model", "langgraph_checkpoint_ns": "tools:2|model:3"}
+    tool_model = {"langgraph_node": "tools", "langgraph_checkpoint_ns": "tools:2"}
+    tokens = (
+        ("Which ", reply),
+        ("subagent tokens", subagent),
+        ([{"type": "text", "text": "ERC "}, {"type": "tool_use", "id": "t"}], reply),
+        ("generated solidity", tool_model),
+        ("standard?", reply),
+    )
+
+    def fake_agent(_intent):
+        return FakePlanningAgent(content="Which ERC standard?", tokens=tokens)
+
+    monkeypatch.setattr(agent_registry, "get_agent_for_intent", fake_agent)
+    monkeypatch.setattr(planning_tools, "get_approval_request", lambda: None)
+    monkeypatch.setattr(planning_tools, "get_answer_recommendations", lambda: [])
+    monkeypatch.setattr(planning_tools, "get_pending_questions", lambda: [])
+    monkeypatch.setattr(planning_tools, "clear_pending_questions", lambda: None)
+
+    async def scenario(stream_tokens):
+        events = []
+        async for event in agent_registry.stream_chat_with_intent(
+            intent="planning",
+            session_id="session-123",
+            user_message="I want a token.",
+            project_id="project-123",
+            stream_tokens=stream_tokens,
+        ):
+            events.append(event)
+        return events
+
+    events = asyncio.run(scenario(True))
+
+    assert [event["type"] for event in events] == [
+        "token",
+        "token",
+        "token",
+        "step",
+        "done",
+    ]
+    assert "".join(e["content"] for e in events if e["type"] == "token") == (
+        "Which ERC standard?"
+    )
+    assert events[-1]["response"] == "Which ERC standard?"
+    assert [e["type"] for e in asyncio.run(scenario(False))] == ["step", "done"]
+
+
+def test_turn_tool_calls_ignore_earlier_turns():
+    from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+    messages = [
+        HumanMessage(content="Start planning."),
+        AIMessage(
+            content="",
+            tool_calls=[{"name": "get_current_plan", "args": {}, "id": "call-1"}],
+        ),
+        ToolMessage(content="{}", tool_call_id="call-1"),
+        AIMessage(content="What should the token be called?"),
+        HumanMessage(content="PartyToken."),
+        AIMessage(
+            content="",
+            tool_calls=[
+                {"name": "save_plan_draft", "args": {}, "id": "call-2"},
+                {"name": "save_reasoning_note", "args": {}, "id": "call-3"},
+            ],
+        ),
+        ToolMessage(content="{}", tool_call_id="call-2"),
+        ToolMessage(content="{}", tool_call_id="call-3"),
+        AIMessage(content="Saved."),
+    ]
+
+    assert agent_registry.turn_tool_calls(messages) == [
+        "save_plan_draft",
+        "save_reasoning_note",
+    ]
+
+
+def test_achat_with_intent_awaits_agent_turn(monkeypatch):
+    class FakeAsyncAgent:
+        async def ainvoke(self, _payload, *, config):
+            assert config == {"configurable": {"thread_id": "project-123"}}
+            return {
+                "messages": [
+                    SimpleNamespace(
+                        content="Which ERC standard should we use?",
+                        tool_calls=[{"name": "send_question_batch"}],
+                    )
+                ]
+            }
+
+        def invoke(self, *_args, **_kwargs):
+            raise AssertionError("async chat must not use the blocking invoke")
+
+    monkeypatch.setattr(agent_registry, "get_agent_for_intent", lambda intent: FakeAsyncAgent())
+    monkeypatch.setattr(planning_tools, "clear_pending_questions", lambda: None)
+    monkeypatch.setattr(planning_tools, "get_answer_recommendations", lambda: [])
+    monkeypatch.setattr(
+        planning_tools,
+        "get_pending_questions",
+        lambda: [{"question": "Which ERC standard should we use?"}],
+    )
+
+    result = asyncio.run(
+        agent_registry.achat_with_intent(
+            intent="planning",
+            session_id="session-123",
+            user_message="I want a token.",
+            project_id="project-123",
+        )
+    )
+
+    assert result == {
+        "session_id": "session-123",
+        "response": "Which ERC standard should we use?",
+        "tool_calls": ["send_question_batch"],
+        "answer_recommendations": [],
+        "pending_questions": [{"question": "Which ERC standard should we use?"}],
+    }
@@ -1,4 +1,5 @@
 import asyncio
+import hashlib
 import json
 import uuid
 from types import SimpleNamespace
@@ -200,7 +201,7 @@ def test_run_pipeline_returns_detached_control_response(monkeypatch):
             self.user_id = user_id
             self.project_id = project_id
 
-        def get_plan(self) -> dict:
+        async def aget_plan(self) -> dict:
             return {"status": "ready"}
 
     async def fake_spawn_detached_pipeline_runner(*, project_id, user_id, **kwargs):
@@ -217,7 +218,7 @@ def test_run_pipeline_returns_detached_control_response(monkeypatch):
         return SimpleNamespace(status="running")
 
     monkeypatch.setattr(api, "ensure_project_context", _noop_ensure_project_context)
-    monkeypatch.setattr(api, "MemoryManager", ReadyMemoryManager)
+    monkeypatch.setattr(api, "get_memory_manager", ReadyMemoryManager)
     monkeypatch.setattr(
         api,
         "spawn_detached_pipeline_runner",
@@ -397,10 +398,12 @@ def test_state_stream_emits_initial_snapshot_for_empty_project(monkeypatch):
     body = asyncio.run(scenario())
 
     assert "event: state_snapshot" in body
-    assert '"project_id": "project-123"' in body
-    assert '"plan": null' in body
-    assert '"artifacts": []' in body
-    assert '"last_deploy_results": []' in body
+    data_line = next(line for line in body.splitlines() if line.startswith("data: "))
+    snapshot = json.loads(data_line[len("data: "):])
+    assert snapshot["project_id"] == "project-123"
+    assert snapshot["plan"]["plan"] is None
+    assert snapshot["code"]["artifacts"] == []
+    assert snapshot["deployment"]["last_deploy_results"] == []
 
 
 def test_state_stream_emits_plan_update_once_when_plan_changes(monkeypatch):
@@ -816,7 +819,7 @@ def test_state_stream_stops_cleanly_on_disconnect_and_validates_context(monkeypa
 
 def test_get_current_deployment_includes_pipeline_tags(monkeypatch):
     monkeypatch.setattr(api, "ensure_project_context", _noop_ensure_project_context)
-    monkeypatch.setattr(api, "MemoryManager", FakeMemoryManager)
+    monkeypatch.setattr(api, "get_memory_manager", FakeMemoryManager)
 
     response = asyncio.run(
         api.get_current_deployment(
@@ -836,7 +839,7 @@ def test_get_current_deployment_includes_pipeline_tags(monkeypatch):
 
 def test_get_current_test_results_includes_pipeline_tags(monkeypatch):
     monkeypatch.setattr(api, "ensure_project_context", _noop_ensure_project_context)
-    monkeypatch.setattr(api, "MemoryManager", FakeMemoryManager)
+    monkeypatch.setattr(api, "get_memory_manager", FakeMemoryManager)
 
     response = asyncio.run(
         api.get_current_test_results(
@@ -856,7 +859,7 @@ def test_get_current_test_results_includes_pipeline_tags(monkeypatch):
 
 def test_get_current_test_results_can_include_output(monkeypatch):
     monkeypatch.setattr(api, "ensure_project_context", _noop_ensure_project_context)
-    monkeypatch.setattr(api, "MemoryManager", FakeMemoryManager)
+    monkeypatch.setattr(api, "get_memory_manager", FakeMemoryManager)
 
     response = asyncio.run(
         api.get_current_test_results(
@@ -869,3 +872,99 @@ def test_get_current_test_results_can_include_output(monkeypatch):
     )
 
     assert response.last_test_results[0]["output"] == "summary"
+
+
+def test_lifespan_injects_mcp_tools_before_building_planning_agent(monkeypatch):
+    calls = []
+
+    async def fake_load_planning_tools():
+        calls.append("load_tools")
+        return ["mcp-tool"]
+
+    async def fake_async_step(name):
+        calls.append(name)
+        return {}
+
+    monkeypatch.setattr(api, "load_planning_tools", fake_load_planning_tools)
+    monkeypatch.setattr(api, "set_planning_mcp_tools", lambda tools: calls.append(("set_tools", tools)))
+    monkeypatch.setattr(api, "create_tables", lambda: fake_async_step("create_tables"))
+    monkeypatch.setattr(api, "configure_tracing", lambda: calls.append("tracing"))
+    monkeypatch.setattr(api, "configure_telegram_webhook", lambda: fake_async_step("webhook"))
+    monkeypatch.setattr(api, "start_notification_dispatcher", lambda: fake_async_step("dispatcher_start"))
+    monkeypatch.setattr(api, "stop_notification_dispatcher", lambda: fake_async_step("dispatcher_stop"))
+    monkeypatch.setattr(api, "build_planning_agent", lambda: calls.append("build_agent"))
+    monkeypatch.setattr(api, "warm_llm_connection_pool", lambda: fake_async_step("warm_llm"))
+
+    async def _run():
+        async with api.lifespan(api.app):
+            calls.append("serving")
+
+    asyncio.run(_run())
+
+    assert calls.index(("set_tools", ["mcp-tool"])) < calls.index("build_agent")
+    assert calls.index("build_agent") < calls.index("warm_llm") < calls.index("serving")
+    assert calls[-1] == "dispatcher_stop"
+
+
+def test_plan_message_stream_emits_planning_events(monkeypatch):
+    saved_messages = []
+    stream_calls = []
+
+    async def fake_append_chat_message(**kwargs):
+        saved_messages.append((kwargs["sender"], kwargs["content"]))
+
+    async def fake_append_chat_message_new_session(**kwargs):
+        saved_messages.append((kwargs["sender"], kwargs["content"]))
+
+    async def fake_stream_chat_with_intent(**kwargs):
+        stream_calls.append(kwargs)
+        yield {"type": "token", "content": "Hi"}
+        yield {"type": "step", "content": "Thinking", "tool_calls": []}
+        yield {"type": "done", "session_id": "session-1", "response": "Hi", "tool_calls": []}
+
+    monkeypatch.setattr(api, "ensure_project_context", _noop_ensure_project_context)
+    monkeypatch.setattr(api, "_append_chat_message", fake_append_chat_message)
+    monkeypatch.setattr(
+        api, "_append_chat_message_new_session", fake_append_chat_message_new_session
+    )
+    monkeypatch.setattr(api, "stream_chat_with_intent", fake_stream_chat_with_intent)
+
+    async def scenario():
+        response = await api.send_message_stream(
+            request=api.MessageRequest(session_id="session-1", message="Hello"),
+            ctx=api.RequestContext(project_id="project-123", user_id="user-123"),
+            session=None,
+        )
+        chunks = []
+        async for chunk in response.body_iterator:
+            chunks.append(chunk)
+        return _decode_stream_chunks(chunks)
+
+    body = asyncio.run(scenario())
+    events = [
+        json.loads(line[len("data: ") :])
+        for line in body.splitlines()
+        if line.startswith("data: ")
+    ]
+
+    assert stream_calls[0]["intent"] == "planning"
+    assert stream_calls[0]["project_id"] == "project-123"
+    assert stream_calls[0]["stream_tokens"] is True
+    assert [event["type"] for event in events] == ["token", "step", "done"]
+    assert saved_messages == [("user", "Hello"), ("agent", "Hi")]
+
+
+def test_sse_frames_and_state_versions_handle_uint256_values():
+    from agents.project_state import _stable_version
+
+    payload = {"amount": 2**200, "label": "Fête", "chain_id": 43113}
+
+    frame = api._format_sse_event("state_snapshot", payload)
+    data_line = next(line for line in frame.splitlines() if line.startswith("data: "))
+
+    assert json.loads(data_line[len("data: "):]) == payload
+    # Hashes stay byte-compatible with earlier releases for non-ASCII text.
+    assert _stable_version({"label": "Fête"}) == hashlib.sha256(
+        b'{"label":"F\\u00eate"}'
+    ).hexdigest()
+    assert len(_stable_version(payload)) == 64
@@ -0,0 +1,34 @@
+from langgraph.checkpoint.base import empty_checkpoint
+
+from agents.checkpointer import BoundedMemorySaver
+
+
+def _config(thread_id: str) -> dict:
+    return {"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}}
+
+
+def _put(saver: BoundedMemorySaver, thread_id: str) -> None:
+    saver.put(_config(thread_id), empty_checkpoint(), {}, {})
+
+
+def test_evicts_least_recently_written_thread():
+    saver = BoundedMemorySaver(max_threads=2)
+    _put(saver, "project-a")
+    _put(saver, "project-b")
+    _put(saver, "project-a")
+    _put(saver, "pipeline:run:task-1")
+
+    assert set(saver.storage) == {"project-a", "pipeline:run:task-1"}
+    assert saver.get_tuple(_config("project-b")) is None
+    assert saver.get_tuple(_config("project-a")) is not None
+
+
+def test_explicit_delete_frees_a_slot():
+    saver = BoundedMemorySaver(max_threads=2)
+    _put(saver, "project-a")
+    _put(saver, "project-b")
+    saver.delete_thread("project-a")
+    _put(saver, "project-c")
+
+    assert saver.get_tuple(_config("project-b")) is not None
+    assert saver.get_tuple(_config("project-c")) is not None
@@ -1,12 +1,18 @@
+import json
+
+import pytest
+
 from agents.deployment_manifest import (
     build_deployment_manifest,
+    dump_deployment_manifest,
     load_deployment_manifest,
     remediate_manifest_post_deploy_calls,
     validate_deploy_script_against_manifest,
+    validate_post_deploy_calls,
 )
 from agents.deployment_tools import generate_foundry_deploy_script_direct
 from agents.pipeline_specs import default_deployment_target_payload
-from schemas.deployment_schema import FoundryDeployScriptGenerationRequest
+from schemas.deployment_schema import DeploymentTarget, FoundryDeployScriptGenerationRequest
 
 
 def _avavest_plan() -> dict:
@@ -275,3 +281,101 @@ def test_generate_foundry_deploy_script_direct_builds_multi_contract_script_from
     assert 'import {AvaVestToken} from "../contracts/AvaVestToken.sol";' in script
     assert vesting_index < token_index < call_index
     assert validate_deploy_script_against_manifest(manifest, script) == []
+
+
+def test_default_deployment_target_payload_returns_independent_copies():
+    payload = default_deployment_target_payload()
+    payload["network"] = "mutated"
+
+    assert default_deployment_target_payload()["network"] == "avalanche_fuji"
+
+
+def test_load_deployment_manifest_round_trips_dumped_json():
+    manifest, issues = build_deployment_manifest(_avavest_plan(), _coding_artifacts())
+    assert issues == []
+    assert manifest is not None
+
+    assert load_deployment_manifest(dump_deployment_manifest(manifest)) == manifest
+
+
+@pytest.mark.parametrize(
+    ("raw", "message"),
+    [
+        ("   ", "empty"),
+        ("[]", "JSON object"),
+        ({"contracts": []}, "deployment_target"),
+        ({"deployment_target": {}, "contracts": {}}, "must be a list"),
+    ],
+)
+def test_load_deployment_manifest_rejects_malformed_input_before_validation(raw, message):
+    with pytest.raises(ValueError, match=message):
+        load_deployment_manifest(raw)
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"network": "Avalanche-Fuji", "name": "Testnet"},
+        {"network": " FUJI ", "name": "Testnet"},
+        {"network": "avax", "name": "Fuji"},
+        {"network": "custom", "name": "custom", "description": "Avalanche / Fuji"},
+        {"network": "custom", "name": "custom", "chain_id": 43113},
+    ],
+)
+def test_deployment_target_normalizes_fuji_aliases(payload):
+    target = DeploymentTarget.model_validate(payload)
+
+    assert target.network == "avalanche_fuji"
+    assert target.name == "Avalanche Fuji"
+    assert target.rpc_url_env_var == "FUJI_RPC_URL"
+
+
+def test_deployment_target_leaves_other_networks_alone():
+    target = DeploymentTarget.model_validate({"network": "sepolia", "name": "Sepolia"})
+
+    assert target.network == "sepolia"
+    assert target.chain_id is None
+
+
+def test_validate_post_deploy_calls_resolves_overloads_by_arg_count():
+    plan = _avavest_plan()
+    plan["contracts"][1]["functions"].append(
+        {
+            "name": "mint",
+            "inputs": [
+                {"name": "to", "type": "address", "description": "Recipient"},
+                {"name": "amount", "type": "uint256", "description": "Amount"},
+            ],
+        }
+    )
+    plan["post_deploy_calls"].append(
+        {
+            "target_contract_name": "AvaVestToken",
+            "function_name": "mint",
+            "args": ["<deployed:AvaVestVesting.address>", "1000"],
+            "call_order": 2,
+            "description": "Seed the vesting contract",
+        }
+    )
+
+    assert validate_post_deploy_calls(plan) == []
+
+    plan["post_deploy_calls"][1]["args"].append("extra")
+    issues = validate_post_deploy_calls(plan)
+
+    assert any(
+        "has no overload for 'AvaVestToken.mint' accepting 3 arg(s)" in issue
+        and "Available counts: 1, 2" in issue
+        for issue in issues
+    )
+
+
+def test_dumps_json_falls_back_for_integers_beyond_64_bits():
+    from agents.deployment_tools import _json_size
+    from agents.pipeline_context import dumps_json, format_prompt_json
+
+    payload = {"maxSupply": 2**256 - 1, "name": "PartyToken"}
+
+    assert json.loads(dumps_json(payload)) == payload
+    assert json.loads(format_prompt_json(payload, sort_keys=True)) == payload
+    assert _json_size(payload) == len(dumps_json(payload))
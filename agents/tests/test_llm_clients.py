@@ -0,0 +1,52 @@
+import asyncio
+
+import httpx
+
+from agents import llm_clients
+from agents.llm_clients import get_async_http_client, get_chat_model, get_http_client
+
+
+def test_chat_models_share_pooled_http_clients(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+
+    planning = get_chat_model("gpt-test", 0.3)
+    coding = get_chat_model("gpt-test", 0.1)
+
+    assert get_chat_model("gpt-test", 0.3) is planning
+    assert planning is not coding
+    assert planning.http_client is coding.http_client is get_http_client()
+    assert planning.http_async_client is get_async_http_client()
+    assert llm_clients._HTTP_LIMITS.keepalive_expiry >= 60
+
+
+def test_async_http_client_uses_a_pool_per_event_loop():
+    transport = get_async_http_client()._transport
+
+    async def _loop_transports():
+        return transport._loop_transport(), transport._loop_transport()
+
+    first, same_loop = asyncio.run(_loop_transports())
+    second, _ = asyncio.run(_loop_transports())
+
+    assert first is same_loop
+    assert first is not second
+
+
+def test_warm_llm_connection_pool_hits_provider_and_swallows_errors(monkeypatch, capsys):
+    requested = []
+
+    def handler(request):
+        requested.append(str(request.url))
+        if len(requested) > 1:
+            raise httpx.ConnectError("offline", request=request)
+        return httpx.Response(401)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(llm_clients, "get_async_http_client", lambda: client)
+    monkeypatch.setenv("OPENAI_BASE_URL", "https://llm.example/v1/")
+
+    asyncio.run(llm_clients.warm_llm_connection_pool())
+    asyncio.run(llm_clients.warm_llm_connection_pool())
+
+    assert requested == ["https://llm.example/v1/models"] * 2
+    assert "LLM connection warmup failed" in capsys.readouterr().out
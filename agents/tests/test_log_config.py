@@ -0,0 +1,61 @@
+import logging
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from agents.log_config import parse_log_level
+
+AGENTS_ROOT = Path(__file__).resolve().parents[1]
+
+
+@pytest.mark.parametrize(
+    ("value", "level"),
+    [
+        (None, logging.WARNING),
+        ("info", logging.INFO),
+        (" DEBUG ", logging.DEBUG),
+        ("10", 10),
+        ("verbose", logging.WARNING),
+    ],
+)
+def test_parse_log_level_falls_back_to_warning(value, level):
+    assert parse_log_level(value) == level
+
+
+def _run_entrypoint(partyhat_log: str) -> str:
+    # A fresh interpreter has no pytest handlers, like a real entry point.
+    script = (
+        "from agents.log_config import configure_logging\n"
+        "from agents.memory_manager import logger\n"
+        "configure_logging()\n"
+        "logger.info('[AgentLog] plan_saved')\n"
+        "logger.warning('[MemoryManager] DB error: boom')\n"
+    )
+    env = {**os.environ, "PARTYHAT_LOG": partyhat_log}
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=AGENTS_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+        check=True,
+    )
+    return result.stderr
+
+
+def test_configure_logging_shows_info_records_when_requested():
+    stderr = _run_entrypoint("INFO")
+
+    assert "[AgentLog] plan_saved" in stderr
+    assert "[MemoryManager] DB error: boom" in stderr
+
+
+def test_configure_logging_defaults_to_warnings_only():
+    stderr = _run_entrypoint("")
+
+    assert "[AgentLog] plan_saved" not in stderr
+    assert "[MemoryManager] DB error: boom" in stderr
@@ -0,0 +1,164 @@
+import json
+import uuid
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from letta_client import APIConnectionError, NotFoundError
+
+from agents import memory_manager
+from agents.memory_manager import MemoryManager
+
+
+class CountingBlocks:
+    def __init__(self):
+        self._by_id = {}
+        self.list_calls = 0
+        self.list_labels = []
+        self.retrieve_calls = 0
+
+    def list(self, label=None):
+        self.list_calls += 1
+        self.list_labels.append(label)
+        return [
+            block
+            for block in self._by_id.values()
+            if label is None or block.label == label
+        ]
+
+    def retrieve(self, block_id):
+        self.retrieve_calls += 1
+        if block_id not in self._by_id:
+            request = httpx.Request("GET", f"https://letta.test/v1/blocks/{block_id}")
+            raise NotFoundError(
+                "Block not found",
+                response=httpx.Response(404, request=request),
+                body=None,
+            )
+        return self._by_id[block_id]
+
+    def create(self, label, value, limit):
+        block = SimpleNamespace(id=str(uuid.uuid4()), label=label, value=value, limit=limit)
+        self._by_id[block.id] = block
+        return block
+
+    def update(self, block_id, value):
+        self._by_id[block_id].value = value
+        return self._by_id[block_id]
+
+
+def _make_manager(monkeypatch, tmp_path, blocks=None, api_key="letta-key"):
+    fake_client = SimpleNamespace(
+        blocks=blocks or CountingBlocks(), base_url="https://letta.test/v1/"
+    )
+    monkeypatch.setenv("PARTYHAT_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("LETTA_API_KEY", api_key)
+    monkeypatch.setattr(MemoryManager, "_block_id_cache_global", {})
+    monkeypatch.setattr(memory_manager, "_persisted_block_ids", {})
+    monkeypatch.setattr(
+        "agents.memory_manager._get_letta_client", lambda api_key: fake_client
+    )
+    mm = MemoryManager(user_id="user-123")
+    monkeypatch.setattr(mm, "_db_available", False)
+    return mm, fake_client.blocks
+
+
+def test_repeated_block_reads_reuse_cached_id(monkeypatch, tmp_path):
+    mm, blocks = _make_manager(monkeypatch, tmp_path)
+
+    mm.save_user_preference("preferred_erc", "ERC-20")
+    mm.save_user_preference("preferred_license", "MIT")
+    assert mm.get_user_preferences()["preferred_license"] == "MIT"
+
+    assert blocks.list_calls == 1
+    assert blocks.list_labels == [mm.user_block_label]
+    assert blocks.retrieve_calls == 2
+
+
+def test_deleted_block_falls_back_to_lookup(monkeypatch, tmp_path):
+    mm, blocks = _make_manager(monkeypatch, tmp_path)
+    mm.get_user_profile()
+    mm._block_id_cache[mm.user_block_label] = "missing-block-id"
+
+    assert mm.get_user_profile()["name"] is None
+    assert blocks.list_calls == 2
+
+
+def test_transient_errors_keep_cached_block_id(monkeypatch, tmp_path):
+    mm, blocks = _make_manager(monkeypatch, tmp_path)
+    mm.get_user_profile()
+    cached_id = mm._block_id_cache[mm.user_block_label]
+
+    def _unreachable(block_id):
+        raise APIConnectionError(
+            request=httpx.Request("GET", f"https://letta.test/v1/blocks/{block_id}")
+        )
+
+    monkeypatch.setattr(blocks, "retrieve", _unreachable)
+
+    with pytest.raises(APIConnectionError):
+        mm.get_user_profile()
+    assert mm._block_id_cache[mm.user_block_label] == cached_id
+    assert blocks.list_calls == 1
+
+
+def test_block_ids_persist_across_process_restarts(monkeypatch, tmp_path):
+    mm, blocks = _make_manager(monkeypatch, tmp_path)
+    mm.get_user_profile()
+    assert blocks.list_calls == 1
+
+    # A fresh process starts with an empty in-memory cache.
+    restarted, _ = _make_manager(monkeypatch, tmp_path, blocks=blocks)
+    assert restarted.get_user_profile()["name"] is None
+    assert blocks.list_calls == 1
+    assert len(list(tmp_path.glob("letta_block_ids.*.json"))) == 1
+
+
+def test_persisted_block_ids_are_scoped_to_the_letta_account(monkeypatch, tmp_path):
+    mm, blocks = _make_manager(monkeypatch, tmp_path)
+    mm.get_user_profile()
+
+    other, other_blocks = _make_manager(monkeypatch, tmp_path, api_key="other-key")
+    other.get_user_profile()
+
+    assert other_blocks is not blocks
+    assert other_blocks.list_calls == 1
+    assert other._block_id_cache_path != mm._block_id_cache_path
+
+
+def test_persisting_block_ids_merges_entries_from_other_workers(monkeypatch, tmp_path):
+    monkeypatch.setattr(memory_manager, "_persisted_block_ids", {})
+    monkeypatch.setattr(memory_manager, "_MAX_PERSISTED_BLOCK_IDS", 2)
+    path = str(tmp_path / "letta_block_ids.test.json")
+
+    memory_manager._persist_block_id(path, "project:a", "block-a")
+    # Another worker adds its own entry behind this process's back.
+    (tmp_path / "letta_block_ids.test.json").write_text(
+        json.dumps({"project:a": "block-a", "project:b": "block-b"})
+    )
+    memory_manager._persist_block_id(path, "project:c", "block-c")
+
+    assert memory_manager._read_block_id_file(path) == {
+        "project:b": "block-b",
+        "project:c": "block-c",
+    }
+
+
+def test_read_global_block_never_creates_and_reuses_cached_id(monkeypatch, tmp_path):
+    mm, blocks = _make_manager(monkeypatch, tmp_path)
+
+    assert mm._read_global_block() == ({}, None)
+    assert blocks._by_id == {}
+
+    legacy = blocks.create(
+        label=mm.global_block_label,
+        value=mm._serialize({"agent_log": [{"action": "plan_saved"}]}),
+        limit=10000,
+    )
+    assert mm._read_global_block() == (
+        {"agent_log": [{"action": "plan_saved"}]},
+        legacy,
+    )
+    assert mm._read_global_block()[1] is legacy
+    assert blocks.list_calls == 2
+    assert blocks.retrieve_calls == 1
@@ -1,6 +1,14 @@
+import asyncio
+import logging
+import threading
 import uuid
 from types import SimpleNamespace
 
+import httpx
+import pytest
+from letta_client import NotFoundError
+
+from agents import memory_manager
 from agents.memory_manager import MemoryManager
 from agents.pipeline_specs import default_deployment_target_payload
 
@@ -10,8 +18,12 @@ class FakeBlocks:
         self._by_id = {}
         self._by_label = {}
 
-    def list(self):
-        return list(self._by_id.values())
+    def list(self, label=None):
+        return [
+            block
+            for block in self._by_id.values()
+            if label is None or block.label == label
+        ]
 
     def create(self, label, value, limit):
         block_id = str(uuid.uuid4())
@@ -20,7 +32,14 @@ class FakeBlocks:
         self._by_label[label] = block
         return block
 
-    def get(self, block_id):
+    def retrieve(self, block_id):
+        if block_id not in self._by_id:
+            request = httpx.Request("GET", f"https://letta.test/v1/blocks/{block_id}")
+            raise NotFoundError(
+                "Block not found",
+                response=httpx.Response(404, request=request),
+                body=None,
+            )
         return self._by_id[block_id]
 
     def update(self, block_id, value):
@@ -33,9 +52,10 @@ class FakeLettaClient:
         self.blocks = FakeBlocks()
 
 
-def test_save_plan_keeps_compact_letta_state_and_full_neon_plan(monkeypatch):
+def test_save_plan_keeps_compact_letta_state_and_full_neon_plan(monkeypatch, tmp_path):
     fake_client = FakeLettaClient()
     monkeypatch.setattr("agents.memory_manager._get_letta_client", lambda api_key: fake_client)
+    monkeypatch.setenv("PARTYHAT_CACHE_DIR", str(tmp_path))
 
     project_id = str(uuid.uuid4())
     mm = MemoryManager(user_id="user-123", project_id=project_id)
@@ -89,9 +109,10 @@ def test_save_plan_keeps_compact_letta_state_and_full_neon_plan(monkeypatch):
     assert loaded["contracts"][0]["plan_contract_id"].startswith("pc_")
 
 
-def test_get_plan_normalizes_legacy_fuji_deployment_target(monkeypatch):
+def test_get_plan_normalizes_legacy_fuji_deployment_target(monkeypatch, tmp_path):
     fake_client = FakeLettaClient()
     monkeypatch.setattr("agents.memory_manager._get_letta_client", lambda api_key: fake_client)
+    monkeypatch.setenv("PARTYHAT_CACHE_DIR", str(tmp_path))
 
     project_id = str(uuid.uuid4())
     mm = MemoryManager(user_id="user-123", project_id=project_id)
@@ -142,3 +163,213 @@ def test_get_plan_normalizes_legacy_fuji_deployment_target(monkeypatch):
         loaded["deployment_target"]["private_key_env_var"]
         == default_deployment_target_payload()["private_key_env_var"]
     )
+
+
+def test_save_plan_reuses_caller_supplied_previous_plan(monkeypatch, tmp_path):
+    fake_client = FakeLettaClient()
+    monkeypatch.setattr("agents.memory_manager._get_letta_client", lambda api_key: fake_client)
+    monkeypatch.setenv("PARTYHAT_CACHE_DIR", str(tmp_path))
+
+    mm = MemoryManager(user_id="user-123")
+    monkeypatch.setattr(mm, "_db_available", False)
+    mm.save_plan(
+        {
+            "project_name": "PartyToken",
+            "status": "draft",
+            "description": "A token contract.",
+            "contracts": [{"name": "PartyToken", "functions": []}],
+        }
+    )
+    stored = mm.get_plan()
+
+    monkeypatch.setattr(mm, "get_plan", lambda: pytest.fail("plan was re-read"))
+    mm.save_plan({**stored, "status": "ready"}, previous_plan=stored)
+
+    data, _ = mm._read_user_block()
+    current = data["agents"]["planning"]["current_plan"]
+    assert current["status"] == "ready"
+    assert (
+        current["contracts"][0]["plan_contract_id"]
+        == stored["contracts"][0]["plan_contract_id"]
+    )
+
+
+def test_save_plan_overlaps_neon_upsert_with_state_read(monkeypatch, tmp_path):
+    fake_client = FakeLettaClient()
+    monkeypatch.setattr("agents.memory_manager._get_letta_client", lambda api_key: fake_client)
+    monkeypatch.setenv("PARTYHAT_CACHE_DIR", str(tmp_path))
+
+    mm = MemoryManager(user_id="user-123", project_id=str(uuid.uuid4()))
+    monkeypatch.setattr(mm, "_db_available", False)
+    state_read = threading.Event()
+    saved_plan_row = SimpleNamespace(id=uuid.uuid4())
+
+    def _upsert(coro_factory):
+        # Only completes if the planning state is read while the upsert runs.
+        assert state_read.wait(timeout=5)
+        return saved_plan_row
+
+    original_get_agent_state = mm.get_agent_state
+
+    def _get_agent_state(agent_name):
+        state_read.set()
+        return original_get_agent_state(agent_name)
+
+    monkeypatch.setattr(mm, "_db_call", _upsert)
+    monkeypatch.setattr(mm, "get_agent_state", _get_agent_state)
+
+    mm.save_plan(
+        {"project_name": "PartyToken", "status": "draft", "contracts": []},
+        previous_plan={"project_name": "PartyToken", "contracts": []},
+    )
+
+    data, _ = mm._read_user_block()
+    assert data["agents"]["planning"]["plan_id"] == str(saved_plan_row.id)
+
+
+def test_async_plan_accessors_round_trip(monkeypatch, tmp_path):
+    fake_client = FakeLettaClient()
+    monkeypatch.setattr("agents.memory_manager._get_letta_client", lambda api_key: fake_client)
+    monkeypatch.setenv("PARTYHAT_CACHE_DIR", str(tmp_path))
+
+    mm = MemoryManager(user_id="user-123")
+    monkeypatch.setattr(mm, "_db_available", False)
+
+    async def _round_trip():
+        await mm.asave_plan(
+            {"project_name": "PartyToken", "status": "draft", "contracts": []}
+        )
+        return await mm.aget_plan()
+
+    loaded = asyncio.run(_round_trip())
+
+    assert loaded["project_name"] == "PartyToken"
+    assert loaded["deployment_target"] == default_deployment_target_payload()
+
+
+def test_serialize_round_trips_uint256_values_without_toon(monkeypatch, tmp_path):
+    fake_client = FakeLettaClient()
+    monkeypatch.setattr("agents.memory_manager._get_letta_client", lambda api_key: fake_client)
+    monkeypatch.setenv("PARTYHAT_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(memory_manager, "toon_encode", None)
+    monkeypatch.setattr(memory_manager, "toon_decode", None)
+
+    mm = MemoryManager(user_id="user-123")
+    data = {"amount": 2**256 - 1, "floor": -(2**63) - 1, "chain_id": 43113}
+
+    restored = mm._deserialize(mm._serialize(data))
+
+    assert restored == data
+    assert isinstance(restored["amount"], int)
+
+
+def test_save_reasoning_notes_batches_db_and_state_writes(monkeypatch, tmp_path):
+    fake_client = FakeLettaClient()
+    monkeypatch.setattr("agents.memory_manager._get_letta_client", lambda api_key: fake_client)
+    monkeypatch.setenv("PARTYHAT_CACHE_DIR", str(tmp_path))
+
+    mm = MemoryManager(user_id="user-123", project_id=str(uuid.uuid4()))
+    monkeypatch.setattr(mm, "_db_available", True)
+    db_calls = []
+    monkeypatch.setattr(mm, "_db_call", lambda coro_factory: db_calls.append(coro_factory))
+    states = {"planning": {"note_count": 1}}
+    state_writes = []
+    monkeypatch.setattr(mm, "get_agent_state", lambda agent_name: dict(states[agent_name]))
+
+    def _set_agent_state(agent_name, state):
+        state_writes.append(agent_name)
+        states[agent_name] = state
+
+    monkeypatch.setattr(mm, "set_agent_state", _set_agent_state)
+
+    mm.save_reasoning_notes(["Chose ERC-20", "Capped supply at 1M", "Owner-only mint"])
+
+    assert len(db_calls) == 1
+    assert state_writes == ["planning"]
+    assert states["planning"]["note_count"] == 4
+
+
+def test_save_plan_reads_previous_plan_without_write_backs(monkeypatch, tmp_path):
+    fake_client = FakeLettaClient()
+    monkeypatch.setattr("agents.memory_manager._get_letta_client", lambda api_key: fake_client)
+    monkeypatch.setenv("PARTYHAT_CACHE_DIR", str(tmp_path))
+
+    mm = MemoryManager(user_id="user-123", project_id=str(uuid.uuid4()))
+    monkeypatch.setattr(mm, "_db_available", True)
+    # A legacy row without plan_contract_ids would normally be repaired in place.
+    legacy_plan = {
+        "project_name": "PartyToken",
+        "status": "draft",
+        "contracts": [{"name": "PartyToken", "functions": []}],
+    }
+    responses = iter(
+        [
+            SimpleNamespace(plan_data=legacy_plan, status="draft"),
+            SimpleNamespace(id=uuid.uuid4()),
+        ]
+    )
+    db_calls = []
+
+    def _db_call(coro_factory):
+        db_calls.append(coro_factory)
+        return next(responses)
+
+    monkeypatch.setattr(mm, "_db_call", _db_call)
+    states = {"planning": {}}
+    state_ops = []
+
+    def _get_agent_state(agent_name):
+        state_ops.append("get")
+        return dict(states[agent_name])
+
+    def _set_agent_state(agent_name, state):
+        state_ops.append("set")
+        states[agent_name] = state
+
+    monkeypatch.setattr(mm, "get_agent_state", _get_agent_state)
+    monkeypatch.setattr(mm, "set_agent_state", _set_agent_state)
+
+    mm.save_plan({**legacy_plan, "status": "ready"})
+
+    assert len(db_calls) == 2
+    assert state_ops == ["get", "set"]
+    assert states["planning"]["plan_status"] == "ready"
+
+
+def test_memory_logger_propagates_to_app_logging(caplog):
+    with caplog.at_level(logging.INFO, logger="partyhat.memory"):
+        memory_manager.logger.info("[AgentLog] plan_saved")
+
+    assert memory_manager.logger.handlers == []
+    assert "[AgentLog] plan_saved" in caplog.text
+
+
+def test_prefetch_plan_reads_without_write_backs_off_the_io_pool(monkeypatch, tmp_path):
+    fake_client = FakeLettaClient()
+    monkeypatch.setattr("agents.memory_manager._get_letta_client", lambda api_key: fake_client)
+    monkeypatch.setenv("PARTYHAT_CACHE_DIR", str(tmp_path))
+
+    mm = MemoryManager(user_id="user-123", project_id=str(uuid.uuid4()))
+    monkeypatch.setattr(mm, "_db_available", True)
+    legacy_plan = {
+        "project_name": "PartyToken",
+        "status": "draft",
+        "contracts": [{"name": "PartyToken", "functions": []}],
+    }
+    db_threads = []
+
+    def _db_call(coro_factory):
+        db_threads.append(threading.current_thread().name)
+        return SimpleNamespace(plan_data=legacy_plan, status="draft")
+
+    def _no_state_writes(*args, **kwargs):
+        raise AssertionError("prefetch must not write agent state")
+
+    monkeypatch.setattr(mm, "_db_call", _db_call)
+    monkeypatch.setattr(mm, "set_agent_state", _no_state_writes)
+
+    plan = mm.prefetch_plan().result(timeout=5)
+
+    assert plan["contracts"][0]["plan_contract_id"]
+    assert len(db_threads) == 1
+    assert db_threads[0].startswith("memory-prefetch")
@@ -1932,3 +1932,11 @@ def test_validate_execution_result_surfaces_persistence_failure_summary(monkeypa
     assert valid is False
     assert error == task.result_summary
     assert execution is None
+
+
+def test_chainlink_retry_only_considers_failed_runs():
+    output = "[PASS] testChainlinkPriceFeed() uses AggregatorV3Interface"
+
+    assert orchestrator._should_retry_for_chainlink({"success": True}, output) is False
+    assert orchestrator._should_retry_for_chainlink({"success": False}, output) is True
+    assert orchestrator._should_retry_for_chainlink({"error": "rpc down"}, "rpc down") is False
@@ -0,0 +1,57 @@
+import asyncio
+from types import SimpleNamespace
+
+from agents import planning_agent, planning_tools
+
+
+class FakeStreamingAgent:
+    def __init__(self):
+        self.final_messages = [
+            SimpleNamespace(
+                content="Which ERC standard?",
+                tool_calls=[{"name": "get_current_plan"}],
+            )
+        ]
+
+    async def astream_events(self, _payload, *, config, version):
+        assert config == {"configurable": {"thread_id": "session-123"}}
+        assert version == "v2"
+        yield {"event": "on_chain_start", "data": {}}
+        reply = {"langgraph_node": "model", "langgraph_checkpoint_ns": "model:1"}
+        subagent = {
+            "langgraph_node": "model",
+            "langgraph_checkpoint_ns": "tools:2|model:3",
+        }
+        tool_model = {"langgraph_node": "tools", "langgraph_checkpoint_ns": "tools:2"}
+        for token, metadata in (
+            ("Which ", reply),
+            ("subagent tokens", subagent),
+            ([{"type": "text", "text": "ERC "}, {"type": "tool_use", "id": "t"}], reply),
+            ("generated solidity", tool_model),
+            ("standard?", reply),
+        ):
+            yield {
+                "event": "on_chat_model_stream",
+                "metadata": metadata,
+                "data": {"chunk": SimpleNamespace(content=token)},
+            }
+
+    async def aget_state(self, config):
+        return SimpleNamespace(values={"messages": self.final_messages})
+
+
+def test_astream_chat_writes_tokens_before_returning(monkeypatch, capsys):
+    monkeypatch.setattr(planning_tools, "clear_pending_questions", lambda: None)
+    monkeypatch.setattr(planning_tools, "get_answer_recommendations", lambda: [])
+    monkeypatch.setattr(planning_tools, "get_pending_questions", lambda: [])
+    monkeypatch.setattr(planning_agent, "clear_pending_questions", lambda: None)
+
+    result = asyncio.run(
+        planning_agent.astream_chat(
+            FakeStreamingAgent(), "session-123", "I want a token."
+        )
+    )
+
+    assert capsys.readouterr().out == "Which ERC standard?"
+    assert result["response"] == "Which ERC standard?"
+    assert result["tool_calls"] == ["get_current_plan"]
@@ -1,3 +1,10 @@
+import asyncio
+import copy
+import logging
+import threading
+import time
+from concurrent.futures import Future
+
 from agents import planning_tools
 from schemas.deployment_schema import DeploymentTarget
 from schemas.plan_schema import (
@@ -13,10 +20,19 @@ from schemas.plan_schema import (
 class FakeMemoryManager:
     def __init__(self):
         self.agent_states = {"planning": {}}
+        self._state_lock = threading.RLock()
+
+    def agent_state_lock(self, agent_name: str):
+        return self._state_lock
 
     def get_agent_state(self, agent_name: str) -> dict:
         return self.agent_states.setdefault(agent_name, {})
 
+    def prefetch_plan(self) -> Future:
+        future = Future()
+        future.set_result(self.get_plan())
+        return future
+
     def set_agent_state(self, agent_name: str, state: dict) -> None:
         self.agent_states[agent_name] = state
 
@@ -126,6 +142,33 @@ def test_request_plan_verification_persists_structured_indicator(monkeypatch):
     assert planning_tools.get_approval_request() == result["approval_request"]
 
 
+def test_concurrent_planning_tool_calls_keep_each_others_updates(monkeypatch):
+    class SlowCopyingMemoryManager(FakeMemoryManager):
+        def get_agent_state(self, agent_name: str) -> dict:
+            state = copy.deepcopy(super().get_agent_state(agent_name))
+            time.sleep(0.05)
+            return state
+
+    mm = SlowCopyingMemoryManager()
+    monkeypatch.setattr(planning_tools, "_get_memory_manager", lambda: mm)
+
+    calls = [
+        lambda: planning_tools.send_question_batch.invoke(
+            {"questions": [{"question": "Which ERC standard?"}]}
+        ),
+        lambda: planning_tools.request_plan_verification.invoke({}),
+    ]
+    threads = [threading.Thread(target=call) for call in calls]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    state = mm.agent_states["planning"]
+    assert state["pending_questions"][0]["question"] == "Which ERC standard?"
+    assert state["approval_request"]["type"] == "plan_verification"
+
+
 def test_clear_pending_questions_also_clears_approval_request(monkeypatch):
     mm = FakeMemoryManager()
     mm.set_agent_state(
@@ -252,3 +295,193 @@ def test_validate_plan_rejects_invalid_post_deploy_args_for_single_contract_plan
     assert any("arg 2" in issue and "quoted string literal" in issue for issue in result["issues"])
     assert any("arg 3" in issue and "unresolved value 'TBD'" in issue for issue in result["issues"])
     assert any("arg 4" in issue and "unresolved value 'TBD'" in issue for issue in result["issues"])
+
+
+def test_validate_plan_checks_multi_contract_deploy_roles_and_orders():
+    plan = _build_plan(constructor_inputs=[])
+    token = plan.contracts[0]
+    plan.contracts = [
+        token.model_copy(
+            update={"deployment_role": "primary_deployable", "deploy_order": 1}
+        ),
+        token.model_copy(
+            update={
+                "name": "PartyVault",
+                "deployment_role": "primary_deployable",
+                "deploy_order": 1,
+            }
+        ),
+    ]
+
+    result = planning_tools.validate_plan.func(plan)
+
+    assert result["valid"] is False
+    assert any("exactly one contract" in issue for issue in result["issues"])
+    assert any("must be unique" in issue for issue in result["issues"])
+
+
+def test_get_current_plan_consumes_prefetched_plan_once(monkeypatch):
+    reads = []
+
+    class PlanMemoryManager(FakeMemoryManager):
+        def get_plan(self) -> dict:
+            reads.append("read")
+            return {"project_name": f"PartyToken-{len(reads)}"}
+
+    mm = PlanMemoryManager()
+    monkeypatch.setattr(planning_tools, "_get_memory_manager", lambda: mm)
+
+    token = planning_tools.prefetch_current_plan()
+    try:
+        first = planning_tools.get_current_plan.invoke({})
+        second = planning_tools.get_current_plan.invoke({})
+    finally:
+        planning_tools.reset_plan_prefetch(token)
+
+    assert first == {"project_name": "PartyToken-1"}
+    assert second == {"project_name": "PartyToken-2"}
+    assert len(reads) == 2
+
+
+def test_save_plan_draft_discards_prefetched_plan(monkeypatch):
+    class PlanMemoryManager(FakeMemoryManager):
+        def __init__(self):
+            super().__init__()
+            self.plan = {"project_name": "Stale"}
+
+        def get_plan(self) -> dict:
+            return self.plan
+
+        def save_plan(self, plan: dict) -> None:
+            self.plan = plan
+
+        def log_agent_action(self, **kwargs) -> None:
+            pass
+
+    mm = PlanMemoryManager()
+    monkeypatch.setattr(planning_tools, "_get_memory_manager", lambda: mm)
+
+    token = planning_tools.prefetch_current_plan()
+    try:
+        planning_tools.save_plan_draft.invoke(
+            {"plan": _build_plan(constructor_inputs=[]).model_dump()}
+        )
+        current = planning_tools.get_current_plan.invoke({})
+    finally:
+        planning_tools.reset_plan_prefetch(token)
+
+    assert current["project_name"] == "PartyToken"
+
+
+def test_save_plan_draft_stores_json_native_values(monkeypatch):
+    saved = []
+
+    class PlanMemoryManager(FakeMemoryManager):
+        def save_plan(self, plan: dict) -> None:
+            saved.append(plan)
+
+        def log_agent_action(self, **kwargs) -> None:
+            pass
+
+    monkeypatch.setattr(planning_tools, "_get_memory_manager", PlanMemoryManager)
+
+    planning_tools.save_plan_draft.invoke(
+        {"plan": _build_plan(constructor_inputs=[]).model_dump()}
+    )
+
+    assert type(saved[0]["status"]) is str
+    assert saved[0]["status"] == "draft"
+
+
+def test_reasoning_notes_in_a_turn_are_saved_once_on_exit(monkeypatch):
+    saved = []
+
+    class NotesMemoryManager(FakeMemoryManager):
+        def save_reasoning_notes(self, notes):
+            saved.append(list(notes))
+
+    mm = NotesMemoryManager()
+    monkeypatch.setattr(planning_tools, "_get_memory_manager", lambda: mm)
+
+    with planning_tools.ReasoningNoteBatch():
+        queued = planning_tools.save_reasoning_note.invoke({"note": "Use ERC-20"})
+        batch = planning_tools.save_reasoning_notes.invoke(
+            {"notes": ["Owner-only mint", "Cap supply"]}
+        )
+        assert saved == []
+
+    assert queued == {"success": True, "note_queued": "Use ERC-20"}
+    assert batch == {"success": True, "notes_queued": 2}
+
+    assert saved == [["Use ERC-20", "Owner-only mint", "Cap supply"]]
+
+    direct = planning_tools.save_reasoning_note.invoke({"note": "Outside a turn"})
+    assert saved[-1] == ["Outside a turn"]
+    assert direct == {"success": True, "note_saved": "Outside a turn"}
+
+
+def test_failed_reasoning_note_flush_logs_the_notes(monkeypatch, caplog):
+    class FailingMemoryManager(FakeMemoryManager):
+        def save_reasoning_notes(self, notes):
+            raise RuntimeError("neon unavailable")
+
+    monkeypatch.setattr(planning_tools, "_get_memory_manager", FailingMemoryManager)
+
+    with caplog.at_level(logging.ERROR, logger="partyhat.planning"):
+        with planning_tools.ReasoningNoteBatch():
+            planning_tools.save_reasoning_note.invoke({"note": "Use ERC-20"})
+
+    assert "Could not save 1 reasoning note(s)" in caplog.text
+    assert "Use ERC-20" in caplog.text
+    assert "neon unavailable" in caplog.text
+
+
+def test_cancelled_turn_still_flushes_queued_reasoning_notes(monkeypatch):
+    saved = []
+
+    class NotesMemoryManager(FakeMemoryManager):
+        def save_reasoning_notes(self, notes):
+            time.sleep(0.05)
+            saved.append(list(notes))
+
+    monkeypatch.setattr(planning_tools, "_get_memory_manager", NotesMemoryManager)
+
+    async def turn(started):
+        async with planning_tools.ReasoningNoteBatch():
+            planning_tools.save_reasoning_note.invoke({"note": "Use ERC-20"})
+            started.set()
+            await asyncio.sleep(10)
+
+    async def scenario():
+        started = asyncio.Event()
+        task = asyncio.create_task(turn(started))
+        await started.wait()
+        # Cancel scopes (anyio/Starlette) keep re-delivering cancellation.
+        task.cancel()
+        await asyncio.sleep(0.01)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        while planning_tools._pending_flushes:
+            await asyncio.sleep(0.01)
+
+    asyncio.run(scenario())
+
+    assert saved == [["Use ERC-20"]]
+
+
+def test_reset_plan_prefetch_cancels_unused_prefetch(monkeypatch):
+    pending = Future()
+
+    class PlanMemoryManager(FakeMemoryManager):
+        def prefetch_plan(self) -> Future:
+            return pending
+
+    monkeypatch.setattr(planning_tools, "_get_memory_manager", PlanMemoryManager)
+
+    token = planning_tools.prefetch_current_plan()
+    planning_tools.reset_plan_prefetch(token)
+
+    assert pending.cancelled()